@@ -2,5 +2,9 @@ class BaseConstraint:
 
     name = "BaseConstraint"
 
+    # Dotted WorldState fields the constraint depends on (e.g. "agent.velocity").
+    # None means unknown: incremental evaluators always re-run the constraint.
+    reads = None
+
     def evaluate(self, world_state):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
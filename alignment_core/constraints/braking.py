@@ -1,5 +1,6 @@
 import numpy as np
 from .base_constraint import BaseConstraint
+from .kernel_result import BrakingResult, BRAKING_DTYPE, to_records, to_sensitivities
 
 class BrakingKernel(BaseConstraint):
     def __init__(self, max_braking_force, brake_thermal_limit=5000):
@@ -12,15 +13,16 @@ class BrakingKernel(BaseConstraint):
         self.current_heat_joules = 0
         self.g = 9.81
 
-    def evaluate(self, velocity, mass, friction_mu, slope_angle_deg, distance_to_target):
+    def evaluate(self, velocity, mass, friction_mu, slope_angle_deg, distance_to_target, out=None):
         """
         Calculates if the robot can physically stop before the target.
+        out: optional BrakingResult to overwrite instead of allocating one.
         """
         slope_rad = np.radians(slope_angle_deg)
         
         # 1. BRAKE FADE LOGIC
         # Efficiency drops as heat approaches the limit
-        efficiency = max(0.1, 1.0 - (self.current_heat_joules / self.thermal_limit))
+        efficiency = self.brake_efficiency()
         available_mechanical_f = self.max_f * efficiency
 
         # 2. TRACTION LIMIT (The 'Real' ceiling)
@@ -38,11 +40,11 @@ class BrakingKernel(BaseConstraint):
         total_stopping_f = min(available_mechanical_f, max_traction_f) - gravity_f_component
 
         # Runaway check
+        if out is None:
+            out = BrakingResult(self)
+
         if total_stopping_f <= 0:
-            return {
-                "is_legal": False,
-                "reasoning": "VETO: Runaway condition. Gravity exceeds maximum braking capacity."
-            }
+            return out.fill(is_legal=False, is_runaway=True)
 
         # 5. STOPPING DISTANCE (Kinematic Equation)
         # d = v^2 / (2 * a) where a = F/m
@@ -55,14 +57,129 @@ class BrakingKernel(BaseConstraint):
         # Energy = 0.5 * m * v^2
         kinetic_energy = 0.5 * mass * (velocity**2)
 
-        return {
-            "is_legal": is_safe,
-            "stopping_distance_m": round(stopping_distance, 2),
-            "max_decel_ms2": round(max_deceleration, 2),
-            "brake_fade_pct": round((1 - efficiency) * 100, 1),
-            "energy_to_dissipate_j": round(kinetic_energy, 1),
-            "reasoning": self._generate_report(is_safe, stopping_distance, distance_to_target)
-        }
+        return out.fill(
+            is_legal=bool(is_safe),
+            is_runaway=False,
+            stopping_distance=stopping_distance,
+            max_deceleration=max_deceleration,
+            brake_fade_pct=(1 - efficiency) * 100,
+            energy_to_dissipate=kinetic_energy,
+            distance_to_target=distance_to_target
+        )
+
+    def evaluate_batch(self, velocity, mass, friction_mu, slope_angle_deg, distance_to_target):
+        """
+        Vectorized version of evaluate() for auditing many candidates at once.
+        Every argument may be a scalar or a NumPy array; they are broadcast
+        together into a BRAKING_DTYPE structured array of unrounded values.
+        Runaway entries are illegal and report an infinite stopping distance.
+        BrakingResult.from_row() gives the reasoning for any single entry.
+        """
+        velocity, mass, friction_mu, slope_angle_deg, distance_to_target = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (velocity, mass, friction_mu, slope_angle_deg, distance_to_target))
+        )
+        slope_rad = np.radians(slope_angle_deg)
+
+        # 1. BRAKE FADE (shared by every candidate in the batch)
+        efficiency = self.brake_efficiency()
+        available_mechanical_f = self.max_f * efficiency
+
+        # 2-4. TRACTION CEILING, GRAVITY AND NET STOPPING FORCE
+        max_traction_f = friction_mu * mass * self.g * np.cos(slope_rad)
+        gravity_f_component = mass * self.g * np.sin(slope_rad)
+        total_stopping_f = np.minimum(available_mechanical_f, max_traction_f) - gravity_f_component
+
+        # Runaway check
+        is_runaway = total_stopping_f <= 0
+
+        # 5. STOPPING DISTANCE
+        max_deceleration = total_stopping_f / mass
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stopping_distance = np.where(
+                is_runaway, np.inf, (velocity**2) / (2 * max_deceleration + 1e-6)
+            )
+
+        is_safe = ~is_runaway & (stopping_distance < distance_to_target)
+
+        return to_records(
+            BRAKING_DTYPE,
+            is_legal=is_safe,
+            is_runaway=is_runaway,
+            stopping_distance_m=stopping_distance,
+            max_decel_ms2=max_deceleration,
+            brake_fade_pct=np.full(is_safe.shape, (1 - efficiency) * 100),
+            energy_to_dissipate_j=0.5 * mass * (velocity**2),
+            distance_to_target_m=distance_to_target
+        )
+
+    def max_safe_velocity(self, mass, friction_mu, slope_angle_deg, distance_to_target):
+        """
+        Closed-form speed limit: the highest velocity whose stopping distance
+        still fits inside distance_to_target (inverse of d = v^2 / 2a).
+        Accepts scalars or broadcastable arrays. Runaway conditions give 0.
+        """
+        slope_rad = np.radians(slope_angle_deg)
+        available_mechanical_f = self.max_f * self.brake_efficiency()
+        max_traction_f = friction_mu * mass * self.g * np.cos(slope_rad)
+        gravity_f_component = mass * self.g * np.sin(slope_rad)
+        total_stopping_f = np.minimum(available_mechanical_f, max_traction_f) - gravity_f_component
+
+        max_deceleration = total_stopping_f / mass
+        v_squared = np.maximum(distance_to_target, 0) * (2 * max_deceleration + 1e-6)
+        return np.where(total_stopping_f > 0, np.sqrt(np.maximum(v_squared, 0)), 0.0)
+
+    def margin_sensitivities(self, velocity, mass, friction_mu, slope_angle_deg, distance_to_target):
+        """
+        Braking margin 1 - stopping_distance / distance_to_target (> 0 is
+        legal) and its analytic partial derivatives, per degree for slope.
+        Accepts scalars or broadcastable arrays. Runaway points have a
+        margin of -inf and zero derivatives.
+        """
+        velocity, mass, friction_mu, slope_angle_deg, distance_to_target = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (velocity, mass, friction_mu, slope_angle_deg, distance_to_target))
+        )
+        slope_rad = np.radians(slope_angle_deg)
+        sin_s, cos_s = np.sin(slope_rad), np.cos(slope_rad)
+
+        # 1. DECELERATION and its slope/mass partials on the active branch
+        available_mechanical_f = self.max_f * self.brake_efficiency()
+        max_traction_f = friction_mu * mass * self.g * cos_s
+        traction_limited = max_traction_f < available_mechanical_f
+        total_stopping_f = np.minimum(available_mechanical_f, max_traction_f) - mass * self.g * sin_s
+        is_runaway = total_stopping_f <= 0
+
+        decel = total_stopping_f / mass
+        # Traction-limited: a = mu*g*cos - g*sin; mechanical: a = F/m - g*sin
+        d_decel_d_slope = np.where(traction_limited, -friction_mu * self.g * sin_s, 0.0) - self.g * cos_s
+        d_decel_d_mass = np.where(traction_limited, 0.0, -available_mechanical_f / mass**2)
+
+        # 2. MARGIN: 1 - v^2 / (D * d) with D = 2a + 1e-6
+        denom = 2 * decel + 1e-6
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stopping_distance = velocity**2 / denom
+            margin = 1.0 - stopping_distance / distance_to_target
+            # dm/da = 2 * stop / (D * d)
+            d_margin_d_decel = 2 * stopping_distance / (denom * distance_to_target)
+            d_velocity = -2 * velocity / (denom * distance_to_target)
+
+        def live(x):
+            return np.where(is_runaway, 0.0, x)
+
+        return to_sensitivities(
+            np.where(is_runaway, -np.inf, margin),
+            velocity=live(d_velocity),
+            slope=live(d_margin_d_decel * d_decel_d_slope * (np.pi / 180)),
+            mass=live(d_margin_d_decel * d_decel_d_mass)
+        )
+
+    def brake_efficiency(self, heat_joules=None):
+        """
+        Fraction of the mechanical braking force still available.
+        heat_joules defaults to the kernel's current heat and may be an array.
+        """
+        if heat_joules is None:
+            heat_joules = self.current_heat_joules
+        return np.maximum(0.1, 1.0 - (heat_joules / self.thermal_limit))
 
     def _generate_report(self, is_safe, stop_dist, target_dist):
         if not is_safe:
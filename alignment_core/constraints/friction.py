@@ -1,25 +1,32 @@
 # FILE: alignment_core/constraints/friction.py
 import numpy as np
 from .base_constraint import BaseConstraint
+from .kernel_result import FrictionResult, FRICTION_DTYPE, to_records, to_sensitivities
 # Ensure the import path matches your directory structure
-from ..physics.mechanics import calculate_dynamic_normal_forces
+from ..physics.mechanics import calculate_dynamic_normal_forces, calculate_dynamic_normal_force_arrays
+from ..physics.vehicle_profile import VehicleProfile
+
+# Grip utilization above which the auditor declares traction loss (panic);
+# speed limits are solved against it rather than the 1.0 legality bound.
+PANIC_GRIP_UTILIZATION = 0.99
 
 class FrictionKernel(BaseConstraint):
     def __init__(self, robot, tire_model, terrain_manager):
         """
-        robot: The RigidBody instance containing mass, wheelbase, and CoG height.
+        robot: VehicleProfile (or RigidBody, snapshotted into one) with mass, wheelbase, and CoG height.
         tire_model: From mechanics.py
         terrain_manager: From world_model/terrain_manager.py
         """
-        self.robot = robot  # Added to access physical constants
+        self.robot = VehicleProfile.of(robot)  # Added to access physical constants
         self.tire = tire_model
         self.terrain = terrain_manager
         self.g = 9.81
 
-    def evaluate(self, velocity, radius, req_accel, slope_deg=0):
+    def evaluate(self, velocity, radius, req_accel, slope_deg=0, out=None):
         """
         Evaluates friction limits while accounting for terrain type, 
         slope angle, and dynamic weight transfer.
+        out: optional FrictionResult to overwrite instead of allocating one.
         """
         # 1. Fetch Surface Primitives from the World Model
         mu_s_base, mu_k_base = self.terrain.get_friction()
@@ -63,15 +70,177 @@ class FrictionKernel(BaseConstraint):
         # Check for sliding or tire saturation (approx 12 degrees)
         is_legal = (utilization < 1.0) and (abs(required_alpha) < 0.21)
 
-        return {
-            "is_legal": is_legal,
-            "current_mu": round(mu_s, 2),
-            "grip_utilization": round(utilization, 3),
-            "slip_angle_deg": round(np.degrees(required_alpha), 2),
-            "front_load_n": round(f_front, 1),
-            "rear_load_n": round(f_rear, 1),
-            "reasoning": self._generate_report(utilization, required_alpha, slope_deg)
+        if out is None:
+            out = FrictionResult(self)
+
+        return out.fill(
+            is_legal=bool(is_legal),
+            current_mu=mu_s,
+            grip_utilization=utilization,
+            slip_angle_rad=required_alpha,
+            front_load=f_front,
+            rear_load=f_rear,
+            slope_deg=slope_deg
+        )
+
+    def evaluate_trajectory(self, velocity, radius, req_accel, slope_deg=0, surface_mu=None):
+        """
+        Evaluates a whole trajectory in one vectorized pass.
+        velocity, radius, req_accel, slope_deg: per-point arrays (or scalars).
+        surface_mu: per-point static friction; defaults to the terrain lookup,
+        which is then fetched once for the whole trajectory.
+        Returns (records, first_violation): a FRICTION_DTYPE structured array
+        with one record per point, and the index of the first illegal point
+        (None if the whole trajectory is legal).
+        """
+        if surface_mu is None:
+            surface_mu, _ = self.terrain.get_friction()
+
+        velocity, radius, req_accel, slope_deg, surface_mu = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (velocity, radius, req_accel, slope_deg, surface_mu))
+        )
+
+        # 1-2. Slope-corrected surface friction
+        mu_s = surface_mu * np.cos(np.radians(slope_deg))
+
+        # 3. Dynamic normal forces for every point
+        f_front, f_rear = calculate_dynamic_normal_force_arrays(
+            mass=self.robot.m,
+            acceleration=req_accel,
+            com_height=self.robot.cog_z,
+            wheelbase=self.robot.wb
+        )
+        normal_force_min = np.minimum(f_front, f_rear)
+        normal_force_total = f_front + f_rear
+
+        # 4. Required lateral force (zero on straight segments)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lat_accel = np.where(radius != 0, velocity**2 / radius, 0.0)
+        f_lat_req = (normal_force_total / self.g) * lat_accel
+
+        # 5-6. Slip angle and longitudinal force
+        required_alpha = f_lat_req / (self.tire.ca + 1e-6)
+        f_long_req = (normal_force_total / self.g) * req_accel
+
+        # 7. Friction circle per axle
+        total_force_per_axle = np.sqrt((f_lat_req / 2)**2 + (f_long_req / 2)**2)
+        max_static_grip_per_axle = normal_force_min * mu_s
+        utilization = total_force_per_axle / (max_static_grip_per_axle + 1e-6)
+
+        is_legal = (utilization < 1.0) & (np.abs(required_alpha) < 0.21)
+        violations = np.flatnonzero(~is_legal)
+
+        records = to_records(
+            FRICTION_DTYPE,
+            is_legal=is_legal,
+            current_mu=mu_s,
+            grip_utilization=utilization,
+            slip_angle_deg=np.degrees(required_alpha),
+            front_load_n=f_front,
+            rear_load_n=f_rear,
+            slope_deg=slope_deg
+        )
+        return records, int(violations[0]) if violations.size else None
+
+    def max_safe_velocity(self, radius, req_accel=0, slope_deg=0, surface_mu=None):
+        """
+        Closed-form speed limit from the friction circle, capped at
+        PANIC_GRIP_UTILIZATION, and the slip-angle ceiling used by
+        evaluate(). Accepts scalars or broadcastable arrays.
+        Straight segments (radius 0) are unlimited unless the longitudinal
+        demand alone saturates the tires, in which case the limit is 0.
+        """
+        if surface_mu is None:
+            surface_mu, _ = self.terrain.get_friction()
+
+        mu_s = surface_mu * np.cos(np.radians(slope_deg))
+        f_front, f_rear = calculate_dynamic_normal_force_arrays(
+            mass=self.robot.m,
+            acceleration=req_accel,
+            com_height=self.robot.cog_z,
+            wheelbase=self.robot.wb
+        )
+        effective_mass = (f_front + f_rear) / self.g
+        grip = np.minimum(f_front, f_rear) * mu_s + 1e-6
+
+        # Friction circle: (m*v^2/r)^2 + (m*a)^2 <= (2*panic*grip)^2
+        lateral_budget_sq = (2 * PANIC_GRIP_UTILIZATION * grip)**2 - (effective_mass * req_accel)**2
+        lateral_budget = np.sqrt(np.maximum(lateral_budget_sq, 0))
+
+        # Slip angle: m*v^2/|r| < 0.21 * Ca
+        slip_budget = 0.21 * (self.tire.ca + 1e-6)
+
+        abs_radius = np.abs(radius)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v_squared = abs_radius * np.minimum(lateral_budget, slip_budget) / effective_mass
+        v_squared = np.where(abs_radius > 0, v_squared, np.inf)
+        return np.where(lateral_budget_sq > 0, np.sqrt(v_squared), 0.0)
+
+    def margin_sensitivities(self, velocity, radius, req_accel, slope_deg=0, surface_mu=None,
+                             mass=None, cog_z=None):
+        """
+        Friction margin min(1 - grip_utilization, 1 - |slip_angle| / 0.21)
+        (> 0 is legal) and the analytic partial derivatives of its active
+        term, per degree for slope. mass and cog_z default to the robot's.
+        Accepts scalars or broadcastable arrays.
+        """
+        if surface_mu is None:
+            surface_mu, _ = self.terrain.get_friction()
+        mass = self.robot.m if mass is None else mass
+        cog_z = self.robot.cog_z if cog_z is None else cog_z
+
+        velocity, radius, req_accel, slope_deg, surface_mu, mass, cog_z = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (velocity, radius, req_accel, slope_deg, surface_mu, mass, cog_z))
+        )
+        slope_rad = np.radians(slope_deg)
+        wb = self.robot.wb
+
+        # 1. GRIP: util = Q / (2 * B * mu * cos) with Q = |(lat, a)| and
+        # B = g/2 - |a|*h/wb the rear axle's load per unit mass (mass cancels)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lat_accel = np.where(radius != 0, velocity**2 / radius, 0.0)
+            d_lat_d_v = np.where(radius != 0, 2 * velocity / radius, 0.0)
+            d_lat_d_r = np.where(radius != 0, -lat_accel / radius, 0.0)
+        demand = np.sqrt(lat_accel**2 + req_accel**2)
+        rear_per_mass = self.g / 2 - np.abs(req_accel) * cog_z / wb
+        rear_loaded = rear_per_mass > 0
+
+        f_front, f_rear = calculate_dynamic_normal_force_arrays(mass, req_accel, cog_z, wb)
+        grip = np.minimum(f_front, f_rear) * surface_mu * np.cos(slope_rad)
+        utilization = ((f_front + f_rear) / self.g) * demand / 2 / (grip + 1e-6)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # dU/dx = U * dQ/dx / Q for the demand terms
+            per_demand = np.where(demand > 0, utilization / demand**2, 0.0)
+            per_rear = np.where(rear_loaded, utilization / rear_per_mass, 0.0)
+        grip_partials = {
+            "velocity": -per_demand * lat_accel * d_lat_d_v,
+            "radius": -per_demand * lat_accel * d_lat_d_r,
+            "acceleration": -(per_demand * req_accel + per_rear * np.sign(req_accel) * cog_z / wb),
+            "slope": -utilization * np.tan(slope_rad) * (np.pi / 180),
+            "cog_z": -per_rear * np.abs(req_accel) / wb
+        }
+        grip_margin = 1.0 - utilization
+
+        # 2. SLIP: |alpha| = m * |lat| / Ca
+        slip_scale = 1.0 / (0.21 * (self.tire.ca + 1e-6))
+        sign_lat = np.sign(lat_accel)
+        slip_partials = {
+            "velocity": -slip_scale * mass * sign_lat * d_lat_d_v,
+            "radius": -slip_scale * mass * sign_lat * d_lat_d_r,
+            "mass": -slip_scale * np.abs(lat_accel)
         }
+        slip_margin = 1.0 - slip_scale * mass * np.abs(lat_accel)
+
+        # 3. Active term
+        grip_active = grip_margin <= slip_margin
+        return to_sensitivities(
+            np.minimum(grip_margin, slip_margin),
+            **{
+                name: np.where(grip_active, grip_partials.get(name, 0.0), slip_partials.get(name, 0.0))
+                for name in set(grip_partials) | set(slip_partials)
+            }
+        )
 
     def _generate_report(self, util, alpha, slope):
         if util >= 1.0: 
@@ -0,0 +1,241 @@
+# FILE: alignment_core/constraints/kernel_result.py
+from collections.abc import Mapping
+import numpy as np
+
+# Structured dtypes for batch evaluations (one record per evaluated point)
+BRAKING_DTYPE = np.dtype([
+    ("is_legal", "?"),
+    ("is_runaway", "?"),
+    ("stopping_distance_m", "f8"),
+    ("max_decel_ms2", "f8"),
+    ("brake_fade_pct", "f8"),
+    ("energy_to_dissipate_j", "f8"),
+    ("distance_to_target_m", "f8"),
+])
+
+FRICTION_DTYPE = np.dtype([
+    ("is_legal", "?"),
+    ("current_mu", "f8"),
+    ("grip_utilization", "f8"),
+    ("slip_angle_deg", "f8"),
+    ("front_load_n", "f8"),
+    ("rear_load_n", "f8"),
+    ("slope_deg", "f8"),
+])
+
+STABILITY_DTYPE = np.dtype([
+    ("is_legal", "?"),
+    ("stability_margin", "f8"),
+    ("front_load_pct", "f8"),
+    ("downforce_n", "f8"),
+])
+
+
+def to_records(dtype, **fields):
+    """Packs broadcastable field arrays into one structured array."""
+    shape = np.broadcast_shapes(*(np.shape(v) for v in fields.values()))
+    records = np.empty(shape, dtype=dtype)
+    for name, values in fields.items():
+        records[name] = values
+    return records
+
+
+# Parameters differentiated by the kernels' margin_sensitivities() ('d_<name>' keys)
+SENSITIVITY_PARAMS = ("velocity", "radius", "acceleration", "slope", "mass", "cog_z")
+
+
+def to_sensitivities(margin, **partials):
+    """
+    Packs a margin array and its partial derivatives into a dict keyed
+    'margin' and 'd_<param>'. Parameters not passed have zero derivative.
+    """
+    margin = np.asarray(margin, dtype=float)
+    unknown = set(partials) - set(SENSITIVITY_PARAMS)
+    if unknown:
+        raise KeyError(f"Unknown sensitivity parameters: {sorted(unknown)}")
+
+    sensitivities = {"margin": margin}
+    for name in SENSITIVITY_PARAMS:
+        partial = np.asarray(partials.get(name, 0.0), dtype=float)
+        sensitivities[f"d_{name}"] = np.broadcast_to(partial, margin.shape).copy()
+    return sensitivities
+
+
+class KernelResult(Mapping):
+    """
+    Compact record for one kernel evaluation. Raw (unrounded) values live in
+    slots; the Mapping view reproduces the legacy result dict, rounding on
+    access and formatting 'reasoning' only when it is read.
+    """
+    __slots__ = ("kernel", "is_legal")
+    _keys = ("is_legal", "reasoning")
+
+    def __getitem__(self, key):
+        if key not in self._active_keys():
+            raise KeyError(key)
+        if key == "is_legal":
+            return self.is_legal
+        if key == "reasoning":
+            return self.reasoning
+        return self._value(key)
+
+    def __contains__(self, key):
+        return key in self._active_keys()
+
+    def __iter__(self):
+        return iter(self._active_keys())
+
+    def __len__(self):
+        return len(self._active_keys())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def _active_keys(self):
+        return self._keys
+
+    def _value(self, key):
+        raise KeyError(key)
+
+    @property
+    def reasoning(self):
+        raise NotImplementedError
+
+
+class BrakingResult(KernelResult):
+    __slots__ = ("is_runaway", "stopping_distance", "max_deceleration",
+                 "brake_fade_pct", "energy_to_dissipate", "distance_to_target")
+    _keys = ("is_legal", "stopping_distance_m", "max_decel_ms2", "brake_fade_pct",
+             "energy_to_dissipate_j", "reasoning")
+    _runaway_keys = ("is_legal", "reasoning")
+
+    def __init__(self, kernel, is_legal=False, is_runaway=False, stopping_distance=float("inf"),
+                 max_deceleration=0.0, brake_fade_pct=0.0, energy_to_dissipate=0.0,
+                 distance_to_target=0.0):
+        self.kernel = kernel
+        self.fill(is_legal, is_runaway, stopping_distance, max_deceleration,
+                  brake_fade_pct, energy_to_dissipate, distance_to_target)
+
+    def fill(self, is_legal, is_runaway, stopping_distance=float("inf"),
+             max_deceleration=0.0, brake_fade_pct=0.0, energy_to_dissipate=0.0,
+             distance_to_target=0.0):
+        """Overwrites every field in place so a record can be reused as a buffer."""
+        self.is_legal = is_legal
+        self.is_runaway = is_runaway
+        self.stopping_distance = stopping_distance
+        self.max_deceleration = max_deceleration
+        self.brake_fade_pct = brake_fade_pct
+        self.energy_to_dissipate = energy_to_dissipate
+        self.distance_to_target = distance_to_target
+        return self
+
+    @classmethod
+    def from_row(cls, kernel, row):
+        """Lazy record for one element of a BRAKING_DTYPE batch."""
+        return cls(kernel, bool(row["is_legal"]), bool(row["is_runaway"]),
+                   float(row["stopping_distance_m"]), float(row["max_decel_ms2"]),
+                   float(row["brake_fade_pct"]), float(row["energy_to_dissipate_j"]),
+                   float(row["distance_to_target_m"]))
+
+    def _active_keys(self):
+        return self._runaway_keys if self.is_runaway else self._keys
+
+    def _value(self, key):
+        if key == "stopping_distance_m":
+            return round(self.stopping_distance, 2)
+        if key == "max_decel_ms2":
+            return round(self.max_deceleration, 2)
+        if key == "brake_fade_pct":
+            return round(self.brake_fade_pct, 1)
+        return round(self.energy_to_dissipate, 1)
+
+    @property
+    def reasoning(self):
+        if self.is_runaway:
+            return "VETO: Runaway condition. Gravity exceeds maximum braking capacity."
+        return self.kernel._generate_report(self.is_legal, self.stopping_distance, self.distance_to_target)
+
+
+class FrictionResult(KernelResult):
+    __slots__ = ("current_mu", "grip_utilization", "slip_angle_rad",
+                 "front_load", "rear_load", "slope_deg")
+    _keys = ("is_legal", "current_mu", "grip_utilization", "slip_angle_deg",
+             "front_load_n", "rear_load_n", "reasoning")
+
+    def __init__(self, kernel, is_legal=False, current_mu=0.0, grip_utilization=0.0,
+                 slip_angle_rad=0.0, front_load=0.0, rear_load=0.0, slope_deg=0.0):
+        self.kernel = kernel
+        self.fill(is_legal, current_mu, grip_utilization, slip_angle_rad,
+                  front_load, rear_load, slope_deg)
+
+    def fill(self, is_legal, current_mu, grip_utilization, slip_angle_rad,
+             front_load, rear_load, slope_deg):
+        """Overwrites every field in place so a record can be reused as a buffer."""
+        self.is_legal = is_legal
+        self.current_mu = current_mu
+        self.grip_utilization = grip_utilization
+        self.slip_angle_rad = slip_angle_rad
+        self.front_load = front_load
+        self.rear_load = rear_load
+        self.slope_deg = slope_deg
+        return self
+
+    @classmethod
+    def from_row(cls, kernel, row):
+        """Lazy record for one element of a FRICTION_DTYPE batch."""
+        return cls(kernel, bool(row["is_legal"]), float(row["current_mu"]),
+                   float(row["grip_utilization"]), float(np.radians(row["slip_angle_deg"])),
+                   float(row["front_load_n"]), float(row["rear_load_n"]), float(row["slope_deg"]))
+
+    def _value(self, key):
+        if key == "current_mu":
+            return round(self.current_mu, 2)
+        if key == "grip_utilization":
+            return round(self.grip_utilization, 3)
+        if key == "slip_angle_deg":
+            return round(np.degrees(self.slip_angle_rad), 2)
+        if key == "front_load_n":
+            return round(self.front_load, 1)
+        return round(self.rear_load, 1)
+
+    @property
+    def reasoning(self):
+        return self.kernel._generate_report(self.grip_utilization, self.slip_angle_rad, self.slope_deg)
+
+
+class StabilityResult(KernelResult):
+    __slots__ = ("stability_margin", "front_load_pct", "downforce")
+    _keys = ("is_legal", "stability_margin", "front_load_pct", "downforce_n", "reasoning")
+
+    def __init__(self, kernel, is_legal=False, stability_margin=0.0, front_load_pct=0.0, downforce=0.0):
+        self.kernel = kernel
+        self.fill(is_legal, stability_margin, front_load_pct, downforce)
+
+    def fill(self, is_legal, stability_margin, front_load_pct, downforce):
+        """Overwrites every field in place so a record can be reused as a buffer."""
+        self.is_legal = is_legal
+        self.stability_margin = stability_margin
+        self.front_load_pct = front_load_pct
+        self.downforce = downforce
+        return self
+
+    @classmethod
+    def from_row(cls, kernel, row):
+        """Lazy record for one element of a STABILITY_DTYPE batch."""
+        return cls(kernel, bool(row["is_legal"]), float(row["stability_margin"]),
+                   float(row["front_load_pct"]), float(row["downforce_n"]))
+
+    def _value(self, key):
+        if key == "stability_margin":
+            return round(self.stability_margin, 3)
+        if key == "front_load_pct":
+            return round(self.front_load_pct, 1)
+        return round(self.downforce, 2)
+
+    @property
+    def reasoning(self):
+        # Front load as a percentage of a 100-unit weight keeps the report's thresholds
+        return self.kernel._generate_report(self.stability_margin, self.front_load_pct, 100.0)
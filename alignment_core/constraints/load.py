@@ -2,41 +2,33 @@
 
 import numpy as np
 from .base_constraint import BaseConstraint
+from .stability import StabilityKernel
+from ..physics.vehicle_profile import VehicleProfile
 
 class LoadKernel(BaseConstraint):
     def __init__(self, robot):
         """
-        robot: The RigidBody instance from mechanics.py
+        robot: the unloaded VehicleProfile (or RigidBody, snapshotted into one).
         """
-        self.robot = robot
-        # Store original "empty" state to allow for resets
-        self.base_mass = robot.m
-        self.base_cog_z = robot.cog_z
-        self.base_cog_x = robot.cog_x
-        self.base_cog_y = robot.cog_y
+        # Original "empty" profile, kept to allow for resets
+        self.base = VehicleProfile.of(robot)
+        self.robot = self.base
 
     def update_payload(self, payload_mass, p_x, p_y, p_z):
         """
         Recalculates the robot's physical identity based on a new load.
         p_x, p_y, p_z: Position of the payload relative to the robot center.
+        The base profile is left untouched: the loaded one is returned under
+        'profile' (and kept as self.robot) for kernels to be rebound to.
         """
-        total_mass = self.base_mass + payload_mass
-        
-        # New CoG = (sum of mass * position) / total_mass
-        new_x = ((self.base_mass * self.base_cog_x) + (payload_mass * p_x)) / total_mass
-        new_y = ((self.base_mass * self.base_cog_y) + (payload_mass * p_y)) / total_mass
-        new_z = ((self.base_mass * self.base_cog_z) + (payload_mass * p_z)) / total_mass
-
-        # Update the RigidBody "Self-Awareness"
-        self.robot.m = total_mass
-        self.robot.cog_x = new_x
-        self.robot.cog_y = new_y
-        self.robot.cog_z = new_z
+        profile = self.base.with_payload(payload_mass, p_x, p_y, p_z)
+        self.robot = profile
 
         return {
-            "new_mass": round(total_mass, 2),
-            "cog_shift_z": round(new_z - self.base_cog_z, 3),
-            "is_lopsided": abs(new_y) > (self.robot.tw * 0.1) # Flag if CoG moved >10% of track width
+            "new_mass": round(profile.m, 2),
+            "cog_shift_z": round(profile.cog_z - self.base.cog_z, 3),
+            "is_lopsided": abs(profile.cog_y) > (profile.tw * 0.1), # Flag if CoG moved >10% of track width
+            "profile": profile
         }
 
     def evaluate_slosh_risk(self, acceleration, fill_level=0.5):
@@ -52,4 +44,81 @@ class LoadKernel(BaseConstraint):
         return {
             "dynamic_shift_m": round(shift_magnitude, 3),
             "risk_factor": "HIGH" if abs(shift_magnitude) > 0.05 else "LOW"
-        }
\ No newline at end of file
+        }
+
+    def placement_sweep(self, payload_masses, xs, ys, zs, accelerations=(0.0,), velocity=0.0,
+                        radius=0.0, slope_angle_deg=0.0, fill_level=None):
+        """
+        Evaluates every payload mass x (x, y, z) placement x longitudinal
+        acceleration level in one vectorized pass, on the unloaded base
+        profile (nothing is mutated). Grids are indexed [mass, x, y, z, accel].
+
+        A placement is admissible when the loaded vehicle passes the
+        StabilityKernel at (velocity, radius, slope), the CoG is not
+        lopsided (>10% of track width) and, for liquid payloads
+        (fill_level given), the slosh shift stays LOW (<= 0.05 m). The slosh
+        shift is applied to the CoG along the acceleration before the
+        stability check.
+
+        'heatmap' is admissible at every acceleration level, indexed
+        [mass, x, y, z]. 'max_mass' holds, for every placement, the highest
+        swept mass reached before the first inadmissible one (NaN if the
+        lightest is already inadmissible, inf if the whole sweep is).
+        Masses must be ascending.
+        """
+        m = np.asarray(payload_masses, dtype=float)
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        z = np.asarray(zs, dtype=float)
+        a = np.asarray(accelerations, dtype=float)
+
+        # 1. COG SHIFT: one array-valued profile for the whole grid
+        loaded = self.base.with_payload(
+            m[:, None, None, None, None],
+            x[None, :, None, None, None],
+            y[None, None, :, None, None],
+            z[None, None, None, :, None]
+        )
+        acceleration = a[None, None, None, None, :]
+
+        # 2. SLOSH: pendulum model of evaluate_slosh_risk(), tan(arctan(a/g)) = a/g
+        if fill_level is None:
+            slosh_shift = np.zeros_like(acceleration)
+        else:
+            slosh_shift = loaded.cog_z * (acceleration / loaded.g) * fill_level
+            # Liquid lags the acceleration, moving the CoG the opposite way
+            loaded = loaded.with_changes(cog_x=loaded.cog_x - slosh_shift)
+        slosh_ok = np.abs(slosh_shift) <= 0.05
+
+        # 3. STABILITY of every loaded configuration
+        stability = StabilityKernel(loaded).evaluate_batch(
+            velocity=velocity,
+            radius=radius,
+            acceleration=acceleration,
+            slope_angle_deg=slope_angle_deg
+        )
+
+        is_lopsided = np.abs(loaded.cog_y) > (loaded.tw * 0.1)
+        admissible = stability["is_legal"] & slosh_ok & ~is_lopsided
+        shape = admissible.shape
+
+        heatmap = admissible.all(axis=-1)
+        blocked = ~heatmap
+        first = blocked.argmax(axis=0)
+        max_mass = np.where(first > 0, m[np.maximum(first - 1, 0)], np.nan)
+
+        return {
+            "payload_masses": m,
+            "xs": x,
+            "ys": y,
+            "zs": z,
+            "accelerations": a,
+            "admissible": admissible,
+            "stability_margin": stability["stability_margin"],
+            "front_load_pct": stability["front_load_pct"],
+            "slosh_shift_m": np.broadcast_to(slosh_shift, shape),
+            "is_lopsided": np.broadcast_to(is_lopsided, shape),
+            "cog_z": np.broadcast_to(loaded.cog_z, shape),
+            "heatmap": heatmap,
+            "max_mass": np.where(blocked.any(axis=0), max_mass, np.inf)
+        }
@@ -0,0 +1,93 @@
+# FILE: alignment_core/constraints/pipeline.py
+import time
+from .kernel_result import KernelResult
+
+VETO = "veto"
+FULL_REPORT = "full_report"
+
+
+def is_passing(result):
+    """Legality of a kernel dict ('is_legal'), a constraint dict ('safe') or a list of them."""
+    if isinstance(result, KernelResult):
+        return result.is_legal
+    if isinstance(result, list):
+        return all(is_passing(r) for r in result)
+    if "is_legal" in result:
+        return bool(result["is_legal"])
+    return bool(result.get("safe", True))
+
+
+class ConstraintPipeline:
+    def __init__(self, entries, mode=VETO, smoothing=0.2):
+        """
+        entries: (name, evaluate, hard) tuples, where evaluate(context) returns
+        a kernel result and hard marks a failure as a veto.
+        mode: VETO stops at the first hard veto and orders kernels by expected
+        cost; FULL_REPORT runs every kernel in registration order.
+        smoothing: weight of the newest sample in the running cost average.
+        """
+        if mode not in (VETO, FULL_REPORT):
+            raise ValueError(f"Unknown pipeline mode: {mode}")
+
+        self.entries = list(entries)
+        self.mode = mode
+        self.smoothing = smoothing
+        self.stats = {
+            name: {"calls": 0, "vetoes": 0, "avg_cost_s": 0.0}
+            for name, _, _ in self.entries
+        }
+        self._veto_order = list(range(len(self.entries)))
+
+    def run(self, context, mode=None):
+        mode = mode or self.mode
+        order = self._veto_order if mode == VETO else range(len(self.entries))
+
+        results = {}
+        vetoed_by = None
+        for i in order:
+            name, evaluate, hard = self.entries[i]
+
+            start = time.perf_counter()
+            result = evaluate(context)
+            elapsed = time.perf_counter() - start
+
+            passed = is_passing(result)
+            self._record(name, elapsed, passed)
+            results[name] = result
+
+            if not passed and hard and vetoed_by is None:
+                vetoed_by = name
+                if mode == VETO:
+                    break
+
+        self._reorder()
+
+        return {
+            "is_legal": vetoed_by is None and all(is_passing(r) for r in results.values()),
+            "vetoed_by": vetoed_by,
+            "results": results
+        }
+
+    def order(self):
+        """Current veto-mode evaluation order, by kernel name."""
+        return [self.entries[i][0] for i in self._veto_order]
+
+    def _record(self, name, elapsed, passed):
+        stats = self.stats[name]
+        stats["calls"] += 1
+        if not passed:
+            stats["vetoes"] += 1
+        if stats["calls"] == 1:
+            stats["avg_cost_s"] = elapsed
+        else:
+            stats["avg_cost_s"] += self.smoothing * (elapsed - stats["avg_cost_s"])
+
+    def _priority(self, i):
+        # Expected cost per veto found: cheap, frequently vetoing kernels first.
+        # Veto rate uses add-one smoothing so unseen kernels are still tried.
+        stats = self.stats[self.entries[i][0]]
+        veto_rate = (stats["vetoes"] + 1) / (stats["calls"] + 2)
+        return stats["avg_cost_s"] / veto_rate
+
+    def _reorder(self):
+        self._veto_order.sort(key=self._priority)
@@ -1,12 +1,31 @@
+from .pipeline import ConstraintPipeline, VETO
+
+
 class ConstraintRegistry:
     def __init__(self):
         self._constraints = []
+        self._entries = []
 
-    def register(self, constraint):
+    def register(self, constraint, name=None, evaluate=None):
+        """
+        constraint: object with evaluate(context), or a kernel together with
+        an `evaluate` adapter that maps the shared context onto its arguments.
+        Only constraints with severity "hard" (the default) stop a veto pipeline.
+        """
         self._constraints.append(constraint)
+        self._entries.append((
+            name or getattr(constraint, "name", type(constraint).__name__),
+            evaluate or constraint.evaluate,
+            getattr(constraint, "severity", "hard") == "hard"
+        ))
 
     def get_all(self):
         return self._constraints
 
     def clear(self):
-        self._constraints = []
\ No newline at end of file
+        self._constraints = []
+        self._entries = []
+
+    def compile(self, mode=VETO):
+        """Builds an evaluation pipeline over the registered constraints."""
+        return ConstraintPipeline(self._entries, mode=mode)
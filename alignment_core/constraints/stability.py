@@ -1,40 +1,24 @@
 import numpy as np
 from .base_constraint import BaseConstraint
+from .kernel_result import StabilityResult, STABILITY_DTYPE, to_records, to_sensitivities
+from ..physics.mechanics import RigidBody
+from ..physics.vehicle_profile import VehicleProfile
 
-class RigidBody:
-    def __init__(self, mass, track_width, wheelbase, cog_z, 
-                 cog_bias_x=0.0, cog_bias_y=0.0, 
-                 k_suspension=25000, c_damping=1500, frontal_area=0.5):
-        self.m = mass          
-        self.tw = track_width  
-        self.wb = wheelbase    
-        self.cog_z = cog_z     
-        
-        # ASYMMETRIC COG: Offset from center (0.0 is perfect center)
-        # y_bias: positive is right, negative is left
-        # x_bias: positive is forward, negative is rear
-        self.cog_y = cog_bias_y 
-        self.cog_x = cog_bias_x 
-        
-        # SUSPENSION & AERO
-        self.k = k_suspension  # N/m
-        self.c = c_damping     # Ns/m
-        self.area = frontal_area
-        self.g = 9.81
-        self.rho = 1.225       # Air density
 
 class StabilityKernel(BaseConstraint):
     def __init__(self, robot: RigidBody):
-        self.robot = robot
+        """robot: a VehicleProfile, or a RigidBody (snapshotted into one)."""
+        self.robot = VehicleProfile.of(robot)
 
-    def evaluate(self, velocity, radius, acceleration, slope_angle_deg=0, surface_bump_velocity=0):
+    def evaluate(self, velocity, radius, acceleration, slope_angle_deg=0, surface_bump_velocity=0, out=None):
         """
         The Final Audit: Validates equilibrium across all axes.
+        out: optional StabilityResult to overwrite instead of allocating one.
         """
         # 1. AERO DOWNFORCE
         # Cl_area is the downforce coefficient; as speed increases, stability increases
-        f_downforce = 0.5 * self.robot.rho * (velocity**2) * self.robot.area * 0.3 
-        effective_weight = (self.robot.m * self.robot.g) + f_downforce
+        f_downforce = self.robot.k_aero * (velocity**2)
+        effective_weight = self.robot.weight + f_downforce
 
         # 2. ASYMMETRIC LATERAL STABILITY (ROLL)
         slope_rad = np.radians(slope_angle_deg)
@@ -42,8 +26,8 @@ class StabilityKernel(BaseConstraint):
         
         # Adjust track width for bias: if bias is -0.1 (left), 
         # the distance to the right wheel is tw/2 + 0.1
-        dist_to_right = (self.robot.tw / 2) - self.robot.cog_y
-        dist_to_left = (self.robot.tw / 2) + self.robot.cog_y
+        dist_to_right = self.robot.dist_to_right
+        dist_to_left = self.robot.dist_to_left
         
         # Choose the critical side based on turn direction
         critical_width = dist_to_right if radius > 0 else dist_to_left
@@ -61,19 +45,202 @@ class StabilityKernel(BaseConstraint):
 
         # 4. LONGITUDINAL AUDIT (PITCH)
         # Adjust wheelbase for bias
-        dist_to_front = (self.robot.wb / 2) - self.robot.cog_x
-        dynamic_shift = (self.robot.m * acceleration * self.robot.cog_z) / self.robot.wb
-        f_front = (effective_weight * (dist_to_front / self.robot.wb)) - dynamic_shift
+        dynamic_shift = self.robot.transfer_per_accel * acceleration
+        f_front = (effective_weight * self.robot.front_share) - dynamic_shift
         
         is_legal = (final_margin > 0.1) and (f_front > (effective_weight * 0.05))
 
-        return {
-            "is_legal": is_legal,
-            "stability_margin": round(final_margin, 3),
-            "front_load_pct": round((f_front / effective_weight) * 100, 1),
-            "downforce_n": round(f_downforce, 2),
-            "reasoning": self._generate_report(final_margin, f_front, effective_weight)
+        if out is None:
+            out = StabilityResult(self)
+
+        return out.fill(
+            is_legal=bool(is_legal),
+            stability_margin=final_margin,
+            front_load_pct=(f_front / effective_weight) * 100,
+            downforce=f_downforce
+        )
+
+    def evaluate_batch(self, velocity, radius, acceleration, slope_angle_deg=0, surface_bump_velocity=0):
+        """
+        Vectorized version of evaluate(). Arguments are broadcast together
+        into a STABILITY_DTYPE structured array of unrounded values.
+        """
+        velocity, radius, acceleration, slope_angle_deg, surface_bump_velocity = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (velocity, radius, acceleration, slope_angle_deg, surface_bump_velocity))
+        )
+
+        # 1. AERO DOWNFORCE
+        f_downforce = self.robot.k_aero * (velocity**2)
+        effective_weight = self.robot.weight + f_downforce
+
+        # 2. ASYMMETRIC LATERAL STABILITY (ROLL)
+        slope_rad = np.radians(slope_angle_deg)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lat_accel_ms2 = np.where(radius != 0, (velocity**2) / radius, 0.0)
+
+        dist_to_right = self.robot.dist_to_right
+        dist_to_left = self.robot.dist_to_left
+        critical_width = np.where(radius > 0, dist_to_right, dist_to_left)
+
+        restoring_moment = effective_weight * critical_width * np.cos(slope_rad)
+        overturning_moment = self.robot.m * lat_accel_ms2 * self.robot.cog_z
+
+        # 3. DAMPING CHECK
+        dynamic_stability_loss = self.robot.c * surface_bump_velocity * self.robot.cog_z
+
+        final_margin = (restoring_moment - overturning_moment - dynamic_stability_loss) / restoring_moment
+
+        # 4. LONGITUDINAL AUDIT (PITCH)
+        dynamic_shift = self.robot.transfer_per_accel * acceleration
+        f_front = (effective_weight * self.robot.front_share) - dynamic_shift
+
+        is_legal = (final_margin > 0.1) & (f_front > (effective_weight * 0.05))
+
+        return to_records(
+            STABILITY_DTYPE,
+            is_legal=is_legal,
+            stability_margin=final_margin,
+            front_load_pct=(f_front / effective_weight) * 100,
+            downforce_n=f_downforce
+        )
+
+    def max_safe_velocity(self, radius, acceleration=0, slope_angle_deg=0, surface_bump_velocity=0):
+        """
+        Closed-form speed limit from the roll moment balance (margin > 0.1)
+        and the front-load check, both solved for v^2 including downforce.
+        Accepts scalars or broadcastable arrays. Conditions that are already
+        illegal at standstill give 0; conditions speed can't break give inf.
+        """
+        k_aero = self.robot.k_aero
+        weight = self.robot.weight
+        cos_slope = np.cos(np.radians(slope_angle_deg))
+
+        dist_to_right = self.robot.dist_to_right
+        dist_to_left = self.robot.dist_to_left
+        critical_width = np.where(radius > 0, dist_to_right, dist_to_left)
+
+        # 1. ROLL: m*h*v^2/r + c*bump*h < 0.9 * (m*g + k*v^2) * w * cos
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roll_per_v2 = np.where(radius != 0, self.robot.m * self.robot.cog_z / radius, 0.0)
+        a_roll = roll_per_v2 - 0.9 * k_aero * critical_width * cos_slope
+        b_roll = (0.9 * weight * critical_width * cos_slope
+                  - self.robot.c * surface_bump_velocity * self.robot.cog_z)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roll_v2 = np.where(a_roll > 0, b_roll / a_roll, np.inf)
+        roll_v2 = np.where(b_roll > 0, roll_v2, 0.0)
+
+        # 2. PITCH: (m*g + k*v^2) * q > m*a*h/wb
+        q = self.robot.front_share - 0.05
+        shift = self.robot.transfer_per_accel * acceleration
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pitch_v2 = np.where(q < 0, (shift / q - weight) / k_aero, np.inf)
+        pitch_v2 = np.where((q >= 0) & (weight * q <= shift), 0.0, pitch_v2)
+
+        return np.sqrt(np.maximum(np.minimum(roll_v2, pitch_v2), 0))
+
+    def margin_sensitivities(self, velocity, radius, acceleration, slope_angle_deg=0, surface_bump_velocity=0,
+                             mass=None, cog_z=None):
+        """
+        Stability margin min(roll margin - 0.1, front load share - 0.05)
+        (> 0 is legal) and the analytic partial derivatives of its active
+        term, per degree for slope. mass and cog_z default to the robot's.
+        Accepts scalars or broadcastable arrays.
+        """
+        mass = self.robot.m if mass is None else mass
+        cog_z = self.robot.cog_z if cog_z is None else cog_z
+
+        velocity, radius, acceleration, slope_angle_deg, surface_bump_velocity, mass, cog_z = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in
+              (velocity, radius, acceleration, slope_angle_deg, surface_bump_velocity, mass, cog_z))
+        )
+        g = self.robot.g
+        k_aero = self.robot.k_aero
+        weight = mass * g + k_aero * velocity**2
+        slope_rad = np.radians(slope_angle_deg)
+
+        # 1. ROLL: margin = 1 - O / R, O = m*lat*h + c*bump*h, R = W*w*cos
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lat_accel = np.where(radius != 0, velocity**2 / radius, 0.0)
+            d_lat_d_v = np.where(radius != 0, 2 * velocity / radius, 0.0)
+            d_lat_d_r = np.where(radius != 0, -lat_accel / radius, 0.0)
+
+        dist_to_right = self.robot.dist_to_right
+        dist_to_left = self.robot.dist_to_left
+        width_cos = np.where(radius > 0, dist_to_right, dist_to_left) * np.cos(slope_rad)
+
+        restoring = weight * width_cos
+        overturning = (mass * lat_accel + self.robot.c * surface_bump_velocity) * cog_z
+        ratio = overturning / restoring
+        roll_partials = {
+            "velocity": -(mass * cog_z * d_lat_d_v - ratio * 2 * k_aero * velocity * width_cos) / restoring,
+            "radius": -mass * cog_z * d_lat_d_r / restoring,
+            "slope": -ratio * np.tan(slope_rad) * (np.pi / 180),
+            "mass": -(lat_accel * cog_z - ratio * g * width_cos) / restoring,
+            "cog_z": -(mass * lat_accel + self.robot.c * surface_bump_velocity) / restoring
+        }
+        roll_margin = (1.0 - ratio) - 0.1
+
+        # 2. PITCH: share = (wb/2 - x)/wb - m*a*h / (wb*W)
+        wb = self.robot.wb
+        shift = mass * acceleration * cog_z / wb
+        pitch_partials = {
+            "velocity": shift * 2 * k_aero * velocity / weight**2,
+            "acceleration": -mass * cog_z / (wb * weight),
+            "mass": -(acceleration * cog_z / wb) * k_aero * velocity**2 / weight**2,
+            "cog_z": -mass * acceleration / (wb * weight)
         }
+        pitch_margin = self.robot.front_share - shift / weight - 0.05
+
+        # 3. Active term
+        roll_active = roll_margin <= pitch_margin
+        return to_sensitivities(
+            np.minimum(roll_margin, pitch_margin),
+            **{
+                name: np.where(roll_active, roll_partials.get(name, 0.0), pitch_partials.get(name, 0.0))
+                for name in set(roll_partials) | set(pitch_partials)
+            }
+        )
+
+    def envelope(self, velocities, radii, slope_angles_deg=(0.0,), bump_velocities=(0.0,),
+                 acceleration=0.0, return_boundary=True):
+        """
+        Maps the stability envelope over a dense grid in one vectorized call.
+        Grids are indexed [velocity, radius, slope, bump_velocity].
+        With return_boundary, 'boundary_velocity' holds, for every
+        (radius, slope, bump) cell, the highest swept velocity reached before
+        the first illegal one (NaN if the lowest velocity is already illegal,
+        inf if the whole sweep is legal). Velocities must be ascending.
+        """
+        v = np.asarray(velocities, dtype=float)
+        r = np.asarray(radii, dtype=float)
+        s = np.asarray(slope_angles_deg, dtype=float)
+        b = np.asarray(bump_velocities, dtype=float)
+
+        grid = self.evaluate_batch(
+            velocity=v[:, None, None, None],
+            radius=r[None, :, None, None],
+            acceleration=acceleration,
+            slope_angle_deg=s[None, None, :, None],
+            surface_bump_velocity=b[None, None, None, :]
+        )
+        result = {
+            "velocities": v,
+            "radii": r,
+            "slope_angles_deg": s,
+            "bump_velocities": b,
+            "is_legal": grid["is_legal"],
+            "stability_margin": grid["stability_margin"],
+            "front_load_pct": grid["front_load_pct"]
+        }
+
+        if return_boundary:
+            illegal = ~grid["is_legal"]
+            has_violation = illegal.any(axis=0)
+            first = illegal.argmax(axis=0)
+            boundary = np.where(first > 0, v[np.maximum(first - 1, 0)], np.nan)
+            result["boundary_velocity"] = np.where(has_violation, boundary, np.inf)
+
+        return result
 
     def _generate_report(self, margin, f_front, total_w):
         if margin < 0: return "VETO: Lateral Overturn imminent (Moment Balance Failure)."
@@ -1,6 +1,39 @@
+import time
+import numpy as np
+
+from ..constraints.registry import ConstraintRegistry
+from ..constraints.pipeline import VETO, FULL_REPORT
+from ..constraints.kernel_result import BrakingResult, FrictionResult, StabilityResult
+from ..constraints.friction import PANIC_GRIP_UTILIZATION
+from ..physics.vehicle_profile import VehicleProfile
+
+
+class RealtimeVerdict:
+    """Reused output buffer of ActionAuditor.audit_realtime()."""
+    __slots__ = ("authorized", "approved_speed", "approved_steering",
+                 "vetoed_by", "deadline_missed", "latency_s")
+
+    def __init__(self):
+        self.authorized = False
+        self.approved_speed = 0.0
+        self.approved_steering = 0.0
+        self.vetoed_by = None
+        self.deadline_missed = False
+        self.latency_s = 0.0
+
+
 class ActionAuditor:
-    def __init__(self, robot, stability, friction, braking, load, logger=None):
-        self.robot = robot
+    def __init__(self, robot, stability, friction, braking, load, logger=None, mode=VETO,
+                 realtime_deadline_s=None, emergency_speed=0.0, latency_window=4096):
+        """
+        mode: VETO stops at the first kernel that vetoes, cheapest likely
+        failure first; FULL_REPORT always runs every kernel.
+        realtime_deadline_s: default per-call budget for audit_realtime().
+        emergency_speed: speed cap applied when that budget is exceeded.
+        latency_window: number of recent audit_realtime() latencies kept.
+        robot: VehicleProfile (a RigidBody is snapshotted into one).
+        """
+        self.robot = VehicleProfile.of(robot)
         self.stability = stability
         self.friction = friction
         self.braking = braking
@@ -8,59 +41,155 @@ class ActionAuditor:
         self.logger = logger
         self.panic_active = False
 
-    def audit_intent(self, state, intent, *args, **kwargs):
-        print(">>> AUDITOR IS RUNNING WITH NEW CODE <<<")
+        self.registry = ConstraintRegistry()
+        if self.stability:
+            self.registry.register(self.stability, name="stability", evaluate=self._evaluate_stability)
+        if self.friction and hasattr(self.friction, 'evaluate'):
+            self.registry.register(self.friction, name="friction", evaluate=self._evaluate_friction)
+        if self.braking:
+            self.registry.register(self.braking, name="braking", evaluate=self._evaluate_braking)
+        self.pipeline = self.registry.compile(mode=mode)
+
+        # Real-time path state, allocated once
+        self.realtime_deadline_s = realtime_deadline_s
+        self.emergency_speed = emergency_speed
+        self._verdict = RealtimeVerdict()
+        self._latencies = np.zeros(latency_window)
+        self._latency_count = 0
+        self.realtime_results = {}
+        self._realtime_handles = ()
+        self.prepare_realtime()
+
+    def audit_intent(self, state, intent, *args, full_report=False, **kwargs):
         # Fix: If brain returns a float instead of a dict, wrap it
         if isinstance(intent, (int, float)):
             intent = {"speed": float(intent), "steering": 0.0}
-            
+
         # Fix: Safely extract slope from positional or keyword arguments
         if args:
             slope = args[0]
         else:
             slope = kwargs.get('slope', 0.0)
-        
-        v_val = intent.get("speed", 0)
-        r_val = intent.get("steering", 0)
-        a_val = intent.get("acceleration", 0)
-        dist_to_obj = state.get("obstacle_distance", 100)
-        
-        results = {}
-        
-        if self.stability:
-            results['stability'] = self.stability.evaluate(
-                velocity=v_val, radius=r_val, acceleration=a_val, slope=slope
-            )
-        
-        if self.friction and hasattr(self.friction, 'evaluate'):
-            results['friction'] = self.friction.evaluate(
-                velocity=v_val, radius=r_val, req_accel=a_val
-            )
-        else:
-            results['friction'] = {'is_legal': True, 'grip_utilization': 0}
 
-        if self.braking:
-            results['braking'] = self.braking.evaluate(
-                velocity=v_val, distance=dist_to_obj, slope=slope
-            )
+        context = {
+            "velocity": intent.get("speed", 0),
+            "radius": intent.get("steering", 0),
+            "acceleration": intent.get("acceleration", 0),
+            "slope": slope,
+            "distance": state.get("obstacle_distance", 100),
+            "surface_mu": state.get("surface_mu")
+        }
+
+        audit = self.pipeline.run(context, mode=FULL_REPORT if full_report else None)
+        results = audit["results"]
+
+        # The traction-loss panic needs friction even when an earlier kernel vetoed
+        if "friction" not in results and self.friction and hasattr(self.friction, 'evaluate'):
+            results["friction"] = self._evaluate_friction(context)
 
         # Emergency Stop if grip utilization is too high
-        if results['friction'].get('grip_utilization', 0) > 0.99:
+        if results.get('friction', {}).get('grip_utilization', 0) > PANIC_GRIP_UTILIZATION:
             return self.emergency_stop(results, "Traction Loss")
 
-        is_safe = all([
-            results.get('stability', {}).get('is_legal', True),
-            results.get('friction', {}).get('is_legal', True),
-            results.get('braking', {}).get('is_legal', True)
-        ])
-        
+        is_safe = audit["is_legal"]
+        vetoed_by = audit["vetoed_by"]
+
         return {
             "authorized": is_safe,
-            "approved_speed": v_val if is_safe else 0.0,
-            "approved_steering": r_val,
-            "kernels": results
+            "approved_speed": context["velocity"] if is_safe else 0.0,
+            "approved_steering": context["radius"],
+            "kernels": results,
+            "vetoed_by": vetoed_by,
+            # Only a veto pays for formatting a reasoning string
+            "summary": results[vetoed_by]["reasoning"] if vetoed_by else "NOMINAL: All kernels within envelope."
         }
 
+    def rebind(self, profile):
+        """
+        Points the auditor and its body-dependent kernels at a new
+        VehicleProfile, e.g. the one returned by LoadKernel.update_payload().
+        """
+        self.robot = VehicleProfile.of(profile)
+        for kernel in (self.stability, self.friction, self.load):
+            if kernel is not None and hasattr(kernel, "robot"):
+                kernel.robot = self.robot
+
+    def prepare_realtime(self):
+        """
+        Resolves kernel handles and result buffers for audit_realtime(),
+        in the pipeline's current veto order. Call again to pick up a new order.
+        """
+        handles = {}
+        if self.stability:
+            self.realtime_results["stability"] = StabilityResult(self.stability)
+            handles["stability"] = self._realtime_stability
+        if self.friction and hasattr(self.friction, 'evaluate'):
+            self.realtime_results["friction"] = FrictionResult(self.friction)
+            handles["friction"] = self._realtime_friction
+        if self.braking:
+            self.realtime_results["braking"] = BrakingResult(self.braking)
+            handles["braking"] = self._realtime_braking
+
+        self._terrain = getattr(self.friction, 'terrain', None)
+        self._realtime_handles = tuple(
+            (name, handles[name], self.realtime_results[name]) for name in self.pipeline.order()
+        )
+
+    def audit_realtime(self, velocity, radius, acceleration=0.0, slope=0.0, distance=100.0,
+                       surface_mu=None, deadline_s=None):
+        """
+        Allocation-free audit for the control loop: no prints, kernel results
+        written into self.realtime_results, and the same RealtimeVerdict
+        returned (and overwritten) on every call. If deadline_s (default
+        realtime_deadline_s) runs out before every kernel has passed, the
+        verdict caps the speed at emergency_speed; it is checked before each
+        kernel after the first, so a finished audit that overran still stands.
+        """
+        start = time.perf_counter()
+        if deadline_s is None:
+            deadline_s = self.realtime_deadline_s
+        if surface_mu is None:
+            surface_mu = self._terrain.get_friction()[0] if self._terrain is not None else 0.8
+
+        verdict = self._verdict
+        verdict.vetoed_by = None
+        verdict.deadline_missed = False
+
+        started = False
+        for name, check, out in self._realtime_handles:
+            # The budget only gates starting another kernel, so a completed audit is never a miss
+            if started and deadline_s is not None and time.perf_counter() - start > deadline_s:
+                verdict.deadline_missed = True
+                break
+            started = True
+            check(velocity, radius, acceleration, slope, distance, surface_mu, out)
+            if not out.is_legal:
+                verdict.vetoed_by = name
+                break
+
+        verdict.authorized = verdict.vetoed_by is None and not verdict.deadline_missed
+        if verdict.authorized:
+            verdict.approved_speed = velocity
+        elif verdict.deadline_missed:
+            verdict.approved_speed = min(velocity, self.emergency_speed)
+        else:
+            verdict.approved_speed = 0.0
+        verdict.approved_steering = radius
+
+        verdict.latency_s = time.perf_counter() - start
+        self._latencies[self._latency_count % len(self._latencies)] = verdict.latency_s
+        self._latency_count += 1
+
+        return verdict
+
+    def latency_percentiles(self):
+        """p50/p99 latency (seconds) over the recent audit_realtime() window."""
+        samples = self._latencies[:min(self._latency_count, len(self._latencies))]
+        if not len(samples):
+            return {"samples": 0, "p50_s": 0.0, "p99_s": 0.0}
+        p50, p99 = np.percentile(samples, [50, 99])
+        return {"samples": len(samples), "p50_s": float(p50), "p99_s": float(p99)}
+
     def emergency_stop(self, kernels, reason):
         if self.logger:
             self.logger.log(f"PANIC: {reason}")
@@ -69,5 +198,42 @@ class ActionAuditor:
             "approved_speed": 0.0,
             "approved_steering": 0.0,
             "kernels": kernels,
-            "panic": True
-        }
\ No newline at end of file
+            "panic": True,
+            "summary": f"PANIC OVERRIDE: {reason}"
+        }
+
+    # Adapters from the shared audit context to each kernel's signature
+    def _evaluate_stability(self, ctx):
+        return self.stability.evaluate(
+            velocity=ctx["velocity"], radius=ctx["radius"],
+            acceleration=ctx["acceleration"], slope_angle_deg=ctx["slope"]
+        )
+
+    def _evaluate_friction(self, ctx):
+        return self.friction.evaluate(
+            velocity=ctx["velocity"], radius=ctx["radius"],
+            req_accel=ctx["acceleration"], slope_deg=ctx["slope"]
+        )
+
+    def _evaluate_braking(self, ctx):
+        mu = ctx["surface_mu"]
+        if mu is None:
+            mu = self.friction.terrain.get_friction()[0] if hasattr(self.friction, 'terrain') else 0.8
+        return self.braking.evaluate(
+            velocity=ctx["velocity"], mass=self.robot.m, friction_mu=mu,
+            slope_angle_deg=ctx["slope"], distance_to_target=ctx["distance"]
+        )
+
+    # Real-time handles: same kernels, positional arguments, reused buffers
+    def _realtime_stability(self, velocity, radius, acceleration, slope, distance, surface_mu, out):
+        return self.stability.evaluate(velocity, radius, acceleration, slope, 0, out)
+
+    def _realtime_friction(self, velocity, radius, acceleration, slope, distance, surface_mu, out):
+        self.friction.evaluate(velocity, radius, acceleration, slope, out)
+        # Mirror audit_intent's traction-loss panic threshold
+        if out.grip_utilization > PANIC_GRIP_UTILIZATION:
+            out.is_legal = False
+        return out
+
+    def _realtime_braking(self, velocity, radius, acceleration, slope, distance, surface_mu, out):
+        return self.braking.evaluate(velocity, self.robot.m, surface_mu, slope, distance, out)
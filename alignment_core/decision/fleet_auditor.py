@@ -0,0 +1,63 @@
+# FILE: alignment_core/decision/fleet_auditor.py
+import numpy as np
+
+from ..constraints.braking import BrakingKernel
+from ..constraints.friction import FrictionKernel
+from ..constraints.stability import StabilityKernel
+from ..physics.mechanics import TireModel
+from ..physics.vehicle_profile import VehicleProfile
+
+# Evaluation order (as ActionAuditor registers its kernels); the first
+# failing kernel is reported as the limiting constraint
+FLEET_CONSTRAINTS = ("stability", "friction", "braking")
+
+
+class FleetAuditor:
+    def audit(self, fleet):
+        """
+        Audits every agent of a FleetStore in one vectorized pass through
+        the stability, friction and braking kernels, with one array-valued
+        VehicleProfile for the whole fleet (payload counted at the CoG).
+        Returns per-agent arrays: overall verdict, the limiting constraint
+        (None if legal), each kernel's verdict and records, and the
+        stopping distance.
+        """
+        # 1. One array-valued vehicle for the whole fleet
+        body = VehicleProfile(
+            m=fleet.column("mass") + fleet.column("load"),
+            tw=fleet.column("track_width"), wb=fleet.column("wheelbase"),
+            cog_z=fleet.column("cog_height"), cog_x=fleet.column("cog_x"), cog_y=fleet.column("cog_y"),
+            max_f_brake=fleet.column("max_braking_force")
+        )
+        stability = StabilityKernel(body)
+        friction = FrictionKernel(body, TireModel(fleet.column("cornering_stiffness")), terrain_manager=None)
+        braking = BrakingKernel(max_braking_force=fleet.column("max_braking_force"))
+
+        # 2. Every kernel over every agent
+        velocity = fleet.column("velocity")
+        radius = fleet.column("radius")
+        acceleration = fleet.column("acceleration")
+        slope = fleet.column("slope")
+        mu = fleet.column("friction")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kernels = {
+                "stability": stability.evaluate_batch(velocity, radius, acceleration, slope),
+                "friction": friction.evaluate_trajectory(velocity, radius, acceleration, slope, mu)[0],
+                "braking": braking.evaluate_batch(velocity, body.m, mu, slope, fleet.column("obstacle_distance"))
+            }
+
+        # 3. Verdicts: the limiting constraint is the first failing kernel
+        checks = {name: kernels[name]["is_legal"] for name in FLEET_CONSTRAINTS}
+        is_legal = np.logical_and.reduce(tuple(checks.values()))
+        limiting = np.full(len(fleet), None, dtype=object)
+        for name in reversed(FLEET_CONSTRAINTS):
+            limiting[~checks[name]] = name
+
+        return {
+            "ids": fleet.ids,
+            "is_legal": is_legal,
+            "limiting_constraint": limiting,
+            "checks": checks,
+            "kernels": kernels,
+            "stopping_distance_m": kernels["braking"]["stopping_distance_m"]
+        }
@@ -0,0 +1,143 @@
+# FILE: alignment_core/decision/limit_finder.py
+import numpy as np
+
+from ..constraints.kernel_result import SENSITIVITY_PARAMS
+from .predictive_kernel import KERNEL_NAMES
+
+
+class LimitFinder:
+    def __init__(self, auditor, tolerance=1e-3, max_iterations=30):
+        """
+        Locates where the combined kernel margin of an ActionAuditor crosses
+        zero along one parameter, using the kernels' analytic
+        margin_sensitivities() for Newton steps. Each step is safeguarded by
+        a bracket [safe, unsafe] and falls back to bisection when Newton
+        would leave it, so convergence is guaranteed.
+        tolerance: width of the final bracket, in the parameter's units.
+        """
+        self.auditor = auditor
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.kernels = [
+            name for name in KERNEL_NAMES
+            if hasattr(getattr(auditor, name, None), "margin_sensitivities")
+        ]
+
+    def margins(self, velocity, radius=0.0, acceleration=0.0, slope=0.0, mass=None, cog_z=None,
+                distance=100.0, surface_mu=None, bump_velocity=0.0):
+        """
+        Combined margin (minimum over kernels, > 0 is legal), its partial
+        derivatives and the index into self.kernels of the active kernel.
+        Accepts scalars or broadcastable arrays.
+        """
+        per_kernel = []
+        for name in self.kernels:
+            kernel = getattr(self.auditor, name)
+            if name == "stability":
+                per_kernel.append(kernel.margin_sensitivities(
+                    velocity, radius, acceleration, slope, bump_velocity, mass=mass, cog_z=cog_z
+                ))
+            elif name == "friction":
+                per_kernel.append(kernel.margin_sensitivities(
+                    velocity, radius, acceleration, slope, surface_mu, mass=mass, cog_z=cog_z
+                ))
+            elif name == "braking":
+                per_kernel.append(kernel.margin_sensitivities(
+                    velocity,
+                    self.auditor.robot.m if mass is None else mass,
+                    self._surface_mu(surface_mu),
+                    slope,
+                    distance
+                ))
+
+        shape = np.broadcast_shapes(*(s["margin"].shape for s in per_kernel))
+        stacked = {
+            key: np.stack([np.broadcast_to(s[key], shape) for s in per_kernel])
+            for key in per_kernel[0]
+        }
+        active = np.argmin(stacked["margin"], axis=0)
+        combined = {
+            key: np.take_along_axis(values, active[None], axis=0)[0]
+            for key, values in stacked.items()
+        }
+        combined["active"] = active
+        return combined
+
+    def find_limit(self, parameter, safe, unsafe, **point):
+        """
+        Finds the value of `parameter` (one of SENSITIVITY_PARAMS) between
+        a legal end `safe` and an illegal end `unsafe` where the combined
+        margin reaches zero, with every other input fixed by **point (see
+        margins()). All arguments may be broadcastable arrays.
+
+        Returns per-point arrays: 'limit' (the last legal value found, within
+        tolerance of the boundary), 'bracketed' (False when the range holds
+        no crossing: limit is NaN if `safe` is already illegal, `unsafe` if
+        the whole range is legal), 'limiting_kernel' and 'iterations'.
+        """
+        if parameter not in SENSITIVITY_PARAMS:
+            raise ValueError(f"Unknown limit parameter: {parameter}")
+        key = f"d_{parameter}"
+
+        def evaluate(x):
+            return self.margins(**{**point, parameter: x})
+
+        # 1. BRACKET: margins at both ends
+        safe_end, unsafe_end = (np.array(x, dtype=float) for x in np.broadcast_arrays(safe, unsafe))
+        at_safe = evaluate(safe_end)
+        at_unsafe = evaluate(unsafe_end)
+        shape = np.broadcast_shapes(safe_end.shape, at_safe["margin"].shape)
+        safe_end, unsafe_end = (np.broadcast_to(x, shape).copy() for x in (safe_end, unsafe_end))
+
+        bracketed = np.broadcast_to((at_safe["margin"] > 0) & (at_unsafe["margin"] <= 0), shape)
+        limiting = np.broadcast_to(at_unsafe["active"], shape).copy()
+        iterations = np.zeros(shape, dtype=int)
+
+        # 2. SAFEGUARDED NEWTON, started from the safe end
+        x = self._next_point(safe_end, np.broadcast_to(at_safe["margin"], shape),
+                             np.broadcast_to(at_safe[key], shape), safe_end, unsafe_end)
+        for _ in range(self.max_iterations):
+            running = bracketed & (np.abs(unsafe_end - safe_end) > self.tolerance)
+            if not running.any():
+                break
+
+            at_x = evaluate(x)
+            margin = np.broadcast_to(at_x["margin"], shape)
+            is_safe = margin > 0
+            safe_end = np.where(running & is_safe, x, safe_end)
+            unsafe_end = np.where(running & ~is_safe, x, unsafe_end)
+            limiting = np.where(running & ~is_safe, np.broadcast_to(at_x["active"], shape), limiting)
+            iterations += running
+
+            x = np.where(running, self._next_point(x, margin, np.broadcast_to(at_x[key], shape),
+                                                   safe_end, unsafe_end), x)
+
+        # 3. RESULT: the legal side of the bracket
+        limit = np.where(bracketed, safe_end, np.where(at_safe["margin"] > 0, unsafe_end, np.nan))
+        names = np.array(self.kernels, dtype=object)
+        return {
+            "limit": limit,
+            "bracketed": bracketed,
+            "limiting_kernel": np.where(bracketed, names[limiting], None),
+            "iterations": iterations
+        }
+
+    def _next_point(self, x, margin, slope, safe_end, unsafe_end):
+        # Newton root estimate, pushed half a tolerance past the root so the
+        # next evaluation lands on the other side and closes the bracket
+        direction = np.sign(unsafe_end - safe_end)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            root = x - margin / slope
+        target = root + np.where(margin > 0, direction, -direction) * self.tolerance / 2
+
+        low, high = np.minimum(safe_end, unsafe_end), np.maximum(safe_end, unsafe_end)
+        inside = np.isfinite(target) & (target > low) & (target < high)
+        return np.where(inside, target, (safe_end + unsafe_end) / 2)
+
+    def _surface_mu(self, surface_mu):
+        if surface_mu is not None:
+            return surface_mu
+        friction = getattr(self.auditor, "friction", None)
+        if friction is not None and hasattr(friction, "terrain"):
+            return friction.terrain.get_friction()[0]
+        return 0.8
@@ -1,31 +1,100 @@
 # FILE: alignment_core/decision/predictive_kernel.py
+import math
+
+KERNEL_NAMES = ("stability", "friction", "braking")
+
 
 class PredictiveKernel:
     def __init__(self, auditor):
         self.auditor = auditor
 
-    def find_optimal_velocity(self, radius, slope=0, dist_to_obj=100, max_possible=40.0):
+        # Kernels exposing a closed-form max_safe_velocity() are solved directly;
+        # the rest are handled by bisection over the full audit.
+        self.solvable = []
+        self.unsolvable = []
+        for name in KERNEL_NAMES:
+            kernel = getattr(auditor, name, None)
+            if kernel is None:
+                continue
+            if hasattr(kernel, "max_safe_velocity"):
+                self.solvable.append(name)
+            else:
+                self.unsolvable.append(name)
+
+    def kernel_limits(self, radius, slope=0, dist_to_obj=100, surface_mu=None):
+        """
+        Direct speed limit of every solvable kernel, keyed by kernel name.
+        Arguments may be scalars or broadcastable arrays.
+        """
+        limits = {}
+        for name in self.solvable:
+            kernel = getattr(self.auditor, name)
+            if name == "stability":
+                limits[name] = kernel.max_safe_velocity(radius=radius, slope_angle_deg=slope)
+            elif name == "friction":
+                limits[name] = kernel.max_safe_velocity(radius=radius, slope_deg=slope, surface_mu=surface_mu)
+            elif name == "braking":
+                limits[name] = kernel.max_safe_velocity(
+                    mass=self.auditor.robot.m,
+                    friction_mu=self._surface_mu(surface_mu),
+                    slope_angle_deg=slope,
+                    distance_to_target=dist_to_obj
+                )
+        return limits
+
+    def find_optimal_velocity(self, radius, slope=0, dist_to_obj=100, max_possible=40.0, surface_mu=None):
         """
         Calculates the absolute limit of physics for the current conditions.
         """
+        optimal_v = max_possible
+        limiting_kernel = None
+
+        # 1. Closed-form limits: the minimum over all solvable kernels
+        for name, limit in self.kernel_limits(radius, slope, dist_to_obj, surface_mu).items():
+            if limit < optimal_v:
+                optimal_v = float(limit)
+                limiting_kernel = name
+
+        # 2. Bisection fallback for kernels without a solver, below that ceiling
+        if self.unsolvable:
+            optimal_v, vetoed_by = self._bisect(radius, slope, dist_to_obj, optimal_v)
+            if vetoed_by:
+                limiting_kernel = vetoed_by
+
+        # Round down: rounding up could push the speed past the limit
+        return {
+            "max_safe_velocity": math.floor(optimal_v * 100) / 100,
+            "reason": f"{limiting_kernel.capitalize()} limit" if limiting_kernel else "No Limit",
+            "limiting_kernel": limiting_kernel
+        }
+
+    def _bisect(self, radius, slope, dist_to_obj, high):
         low = 0.0
-        high = max_possible
         optimal_v = 0.0
-        limiting_reason = "No Limit"
+        vetoed_by = None
+        state = {"obstacle_distance": dist_to_obj}
 
         # Binary search for maximum authorized speed (15 iterations)
         for _ in range(15):
             mid = (low + high) / 2
-            audit = self.auditor.audit_intent(mid, radius, 0, slope=slope, dist_to_obj=dist_to_obj)
-            
+            audit = self.auditor.audit_intent(state, {"speed": mid, "steering": radius}, slope)
+
             if audit["authorized"]:
                 optimal_v = mid
                 low = mid
             else:
-                limiting_reason = audit["summary"]
-                high = mid 
+                vetoed_by = next(
+                    (name for name, result in audit["kernels"].items() if not result.get("is_legal", True)),
+                    vetoed_by
+                )
+                high = mid
 
-        return {
-            "max_safe_velocity": round(optimal_v, 2),
-            "reason": limiting_reason
-        }
\ No newline at end of file
+        return optimal_v, vetoed_by
+
+    def _surface_mu(self, surface_mu):
+        if surface_mu is not None:
+            return surface_mu
+        friction = getattr(self.auditor, "friction", None)
+        if friction is not None and hasattr(friction, "terrain"):
+            return friction.terrain.get_friction()[0]
+        return 0.8
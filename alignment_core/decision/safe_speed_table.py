@@ -0,0 +1,96 @@
+# FILE: alignment_core/decision/safe_speed_table.py
+import time
+import numpy as np
+
+
+class SafeSpeedTable:
+    def __init__(self, predictive_kernel, radii, slopes, surface_mus, distances, max_possible=40.0):
+        """
+        Precomputed maximum safe speed over a radius x slope x surface-friction
+        x obstacle-distance grid, built from the closed-form kernel solvers.
+
+        predictive_kernel: PredictiveKernel whose kernels all expose max_safe_velocity().
+        radii, slopes, surface_mus, distances: ascending grid axes.
+        """
+        if predictive_kernel.unsolvable:
+            raise ValueError(f"Kernels without a closed-form solver: {predictive_kernel.unsolvable}")
+
+        self.kernel = predictive_kernel
+        self.axes = tuple(np.unique(np.asarray(a, dtype=float)) for a in (radii, slopes, surface_mus, distances))
+        self.max_possible = max_possible
+        self.table = None
+        self.build_time_s = 0.0
+        self.rebuilds = 0
+        self._fingerprint = None
+        self.build()
+
+    def fingerprint(self):
+        """Vehicle state the table depends on (VehicleProfile key and brake heat)."""
+        braking = getattr(self.kernel.auditor, "braking", None)
+        heat = braking.current_heat_joules if braking is not None else 0
+        return (self.kernel.auditor.robot.cache_key, heat)
+
+    def is_stale(self):
+        return self._fingerprint != self.fingerprint()
+
+    def build(self):
+        start = time.perf_counter()
+        radius, slope, mu, dist = np.meshgrid(*self.axes, indexing="ij", sparse=True)
+
+        table = np.full(tuple(len(a) for a in self.axes), self.max_possible)
+        for limit in self.kernel.kernel_limits(radius, slope, dist, surface_mu=mu).values():
+            table = np.minimum(table, limit)
+
+        self.table = table
+        self._fingerprint = self.fingerprint()
+        self.build_time_s = time.perf_counter() - start
+        self.rebuilds += 1
+
+    def lookup(self, radius, slope, surface_mu, dist_to_obj):
+        """
+        Multilinear interpolation of the table. The limit surface is concave
+        along every axis over the physical range, so the interpolant never
+        exceeds the exact limit. Cells touching a zero-speed corner (runaway
+        or saturation onset, where concavity breaks) are table misses and
+        return None, as the point itself may still have a large safe speed.
+        Radius, friction and distance above the grid are clamped down to it
+        (the limit grows with all three); anything else outside the grid
+        also returns None so the caller can compute it live.
+        """
+        r_axis, s_axis, mu_axis, d_axis = self.axes
+        if radius < r_axis[0] or surface_mu < mu_axis[0] or dist_to_obj < d_axis[0]:
+            return None
+        if not (s_axis[0] <= slope <= s_axis[-1]):
+            return None
+
+        point = (min(radius, r_axis[-1]), slope, min(surface_mu, mu_axis[-1]), min(dist_to_obj, d_axis[-1]))
+
+        # 1. Locate the enclosing cell and the fractional position inside it
+        index = []
+        weights = []
+        for axis, x in zip(self.axes, point):
+            if len(axis) == 1:
+                index.append(slice(0, 1))
+                weights.append(None)
+                continue
+            i = min(int(np.searchsorted(axis, x, side="right")) - 1, len(axis) - 2)
+            index.append(slice(i, i + 2))
+            weights.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+
+        corners = self.table[tuple(index)]
+        if corners.min() <= 0:
+            return None
+
+        # 2. Contract one axis at a time
+        for t in weights:
+            corners = corners[0] if t is None else corners[0] * (1 - t) + corners[1] * t
+
+        return float(corners)
+
+    def stats(self):
+        return {
+            "points": int(self.table.size),
+            "memory_bytes": int(self.table.nbytes + sum(a.nbytes for a in self.axes)),
+            "build_time_s": round(self.build_time_s, 4),
+            "rebuilds": self.rebuilds
+        }
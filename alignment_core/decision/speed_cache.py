@@ -0,0 +1,98 @@
+# FILE: alignment_core/decision/speed_cache.py
+import math
+from collections import OrderedDict
+
+
+class SafeSpeedCache:
+    def __init__(self, predictor, maxsize=256, radius_step=1.0, slope_step=0.5, distance_step=0.5):
+        """
+        Bounded LRU cache in front of Predictor.get_safe_speed().
+
+        Queries are quantized toward the conservative side before lookup:
+        radius and obstacle distance round down (the limit grows with both),
+        and a slope bucket stores the lower of the limits at its two edges,
+        so a miss costs two solver calls. Misses go through
+        predictor.safe_speed() when it exists; if it raises, the predictor's
+        get_safe_speed() fallback is returned but not cached.
+        The cache empties itself whenever predictor.model_key() changes
+        (vehicle profile, brake heat or terrain state).
+        """
+        self.predictor = predictor
+        self.maxsize = maxsize
+        self.radius_step = radius_step
+        self.slope_step = slope_step
+        self.distance_step = distance_step
+
+        self._entries = OrderedDict()
+        self._model_key = self._current_model_key()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def get_safe_speed(self, radius, slope=0, dist_to_obj=100, terrain=None):
+        model_key = self._current_model_key()
+        if model_key != self._model_key:
+            self.invalidate()
+            self._model_key = model_key
+
+        # 1. Conservative quantization
+        q_radius = self._floor(abs(radius), self.radius_step)
+        if q_radius <= 0:
+            q_radius = abs(radius)
+        q_radius = math.copysign(q_radius, radius)
+        q_dist = max(self._floor(dist_to_obj, self.distance_step), 0.0)
+        slope_low = self._floor(slope, self.slope_step)
+
+        key = (terrain, q_radius, slope_low, q_dist)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        # 2. Miss: evaluate both slope edges of the bucket and keep the lower limit
+        self.misses += 1
+        solve = getattr(self.predictor, "safe_speed", self.predictor.get_safe_speed)
+        try:
+            safe_v = min(
+                solve(q_radius, slope=slope_low, dist_to_obj=q_dist),
+                solve(q_radius, slope=slope_low + self.slope_step, dist_to_obj=q_dist)
+            )
+        except Exception:
+            # Solver failure: serve the predictor's fallback, uncached, so the next query retries
+            self.errors += 1
+            return self.predictor.get_safe_speed(radius, slope=slope, dist_to_obj=dist_to_obj)
+
+        self._entries[key] = safe_v
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return safe_v
+
+    def invalidate(self):
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "size": len(self._entries),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def _current_model_key(self):
+        model_key = getattr(self.predictor, "model_key", None)
+        return model_key() if model_key is not None else None
+
+    @staticmethod
+    def _floor(value, step):
+        return math.floor(value / step) * step
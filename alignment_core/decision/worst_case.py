@@ -0,0 +1,254 @@
+# FILE: alignment_core/decision/worst_case.py
+import math
+
+
+class Interval:
+    """
+    Closed interval [lo, hi] with outward-safe arithmetic: every operation
+    returns an interval containing all values the exact expression can take.
+    """
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo, hi=None):
+        hi = lo if hi is None else hi
+        if lo > hi:
+            raise ValueError(f"Empty interval [{lo}, {hi}]")
+        self.lo = float(lo)
+        self.hi = float(hi)
+
+    @classmethod
+    def of(cls, value):
+        """Coerces a number, (lo, hi) pair or Interval into an Interval."""
+        if isinstance(value, Interval):
+            return value
+        if isinstance(value, (tuple, list)):
+            return cls(*value)
+        return cls(value)
+
+    def __repr__(self):
+        return f"Interval({self.lo}, {self.hi})"
+
+    def contains_zero(self):
+        return self.lo <= 0 <= self.hi
+
+    def __add__(self, other):
+        other = Interval.of(other)
+        return Interval(self.lo + other.lo, self.hi + other.hi)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __sub__(self, other):
+        return self + (-Interval.of(other))
+
+    def __rsub__(self, other):
+        return Interval.of(other) - self
+
+    def __mul__(self, other):
+        other = Interval.of(other)
+        products = (self.lo * other.lo, self.lo * other.hi, self.hi * other.lo, self.hi * other.hi)
+        return Interval(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = Interval.of(other)
+        if other.contains_zero():
+            raise ZeroDivisionError(f"Division by an interval containing zero: {other}")
+        return self * Interval(1.0 / other.hi, 1.0 / other.lo)
+
+    def __rtruediv__(self, other):
+        return Interval.of(other) / self
+
+    def sqr(self):
+        if self.contains_zero():
+            return Interval(0.0, max(self.lo**2, self.hi**2))
+        return Interval(min(self.lo**2, self.hi**2), max(self.lo**2, self.hi**2))
+
+    def sqrt(self):
+        return Interval(math.sqrt(max(self.lo, 0.0)), math.sqrt(max(self.hi, 0.0)))
+
+    def abs(self):
+        if self.contains_zero():
+            return Interval(0.0, max(-self.lo, self.hi))
+        return Interval(min(abs(self.lo), abs(self.hi)), max(abs(self.lo), abs(self.hi)))
+
+    def sin_deg(self):
+        # sin is increasing on (-90, 90) degrees
+        self._check_slope_range()
+        return Interval(math.sin(math.radians(self.lo)), math.sin(math.radians(self.hi)))
+
+    def cos_deg(self):
+        # cos peaks at 0 and falls off on both sides inside (-90, 90) degrees
+        self._check_slope_range()
+        ends = (math.cos(math.radians(self.lo)), math.cos(math.radians(self.hi)))
+        return Interval(min(ends), 1.0 if self.contains_zero() else max(ends))
+
+    def _check_slope_range(self):
+        if self.lo <= -90 or self.hi >= 90:
+            raise ValueError(f"Slope interval outside (-90, 90) degrees: {self}")
+
+
+def minimum(a, b):
+    a, b = Interval.of(a), Interval.of(b)
+    return Interval(min(a.lo, b.lo), min(a.hi, b.hi))
+
+
+def maximum(a, b):
+    a, b = Interval.of(a), Interval.of(b)
+    return Interval(max(a.lo, b.lo), max(a.hi, b.hi))
+
+
+class WorstCaseVerifier:
+    def __init__(self, robot, tire_model, braking_kernel, k_sigma=3.0):
+        """
+        Pushes input intervals through the braking, friction and stability
+        kernel equations and returns guaranteed lower bounds of their margins.
+        robot: RigidBody; tire_model: TireModel; braking_kernel: BrakingKernel.
+        k_sigma: half-width, in standard deviations, of UncertaintyModel bounds.
+        """
+        self.robot = robot
+        self.tire = tire_model
+        self.braking = braking_kernel
+        self.k_sigma = k_sigma
+
+    def verify(self, velocity, friction, slope_deg=0.0, payload=0.0, radius=0.0,
+               acceleration=0.0, distance=100.0, bump_velocity=0.0, uncertainty=None,
+               velocity_splits=1, payload_position=None):
+        """
+        Every physical input may be a number, a (lo, hi) pair or an Interval.
+        payload_position: (x, y, z) of the payload relative to the robot
+        center, as in VehicleProfile.with_payload(); None puts it at the CoG.
+        With an UncertaintyModel, velocity and friction are widened by
+        k_sigma standard deviations. velocity_splits > 1 evaluates that many
+        velocity sub-intervals and keeps the worst, tightening the bounds.
+        Margins are value minus legality threshold: > 0 everywhere means safe.
+        A radius interval spanning 0 (straight, or a turn either way) allows
+        arbitrarily tight turns, so the lateral margins are -inf unless the
+        velocity is 0.
+        """
+        if uncertainty is not None:
+            velocity = uncertainty.velocity_bounds(velocity, self.k_sigma)
+            friction = uncertainty.friction_bounds(friction, self.k_sigma)
+
+        v = Interval.of(velocity)
+        v = Interval(max(v.lo, 0.0), max(v.hi, 0.0))
+        payload = Interval.of(payload)
+        inputs = {
+            "mu": Interval.of(friction),
+            "slope": Interval.of(slope_deg),
+            "mass": self.robot.m + payload,
+            "cog": self._payload_cog(payload, payload_position),
+            "radius": Interval.of(radius),
+            "accel": Interval.of(acceleration),
+            "distance": Interval.of(distance),
+            "bump": Interval.of(bump_velocity)
+        }
+
+        margins = None
+        step = (v.hi - v.lo) / velocity_splits
+        for i in range(velocity_splits):
+            piece = Interval(v.lo + i * step, v.hi if i == velocity_splits - 1 else v.lo + (i + 1) * step)
+            worst = self._margins(piece, **inputs)
+            margins = worst if margins is None else {k: min(margins[k], worst[k]) for k in worst}
+
+        limiting = min(margins, key=margins.get)
+        return {
+            "is_safe": margins[limiting] > 0,
+            "limiting": limiting,
+            **margins
+        }
+
+    def _margins(self, v, mu, slope, mass, cog, radius, accel, distance, bump):
+        g = self.robot.g
+        cos_s, sin_s = slope.cos_deg(), slope.sin_deg()
+        v_sq = v.sqr()
+
+        lat_accel = self._lateral_accel(v_sq, radius)
+
+        return {
+            "braking_margin_m": self._braking(v_sq, mu, cos_s, sin_s, mass, distance, g),
+            **self._friction(lat_accel, mu, cos_s, mass, cog, accel, g),
+            **self._stability(v_sq, lat_accel, cos_s, mass, cog, accel, bump, radius, g)
+        }
+
+    def _payload_cog(self, payload, position):
+        # (cog_x, cog_y, cog_z) of robot + payload by mass moments, as in
+        # VehicleProfile.with_payload(). (m*c + p*x) / (m + p) is monotone in
+        # both p and x, so its range over the box is spanned by the corners.
+        r = self.robot
+        own = (r.cog_x, r.cog_y, r.cog_z)
+        if position is None:
+            return tuple(Interval(c) for c in own)
+
+        cog = []
+        for c, x in zip(own, position):
+            x = Interval.of(x)
+            corners = [(r.m * c + p * xi) / (r.m + p) for p in (payload.lo, payload.hi) for xi in (x.lo, x.hi)]
+            cog.append(Interval(min(corners), max(corners)))
+        return tuple(cog)
+
+    @staticmethod
+    def _lateral_accel(v_sq, radius):
+        # v^2 / r, with radius 0 meaning straight as in the kernels. A radius
+        # interval touching 0 also holds arbitrarily tight turns either way,
+        # so |lat| is unbounded (None) unless the vehicle is standing still.
+        if (radius.lo == radius.hi == 0) or v_sq.hi == 0:
+            return Interval(0.0)
+        if radius.contains_zero():
+            return None
+        return v_sq / radius
+
+    def _braking(self, v_sq, mu, cos_s, sin_s, mass, distance, g):
+        # Stopping distance v^2 / 2a with a = (min(F_mech, mu*m*g*cos) - m*g*sin) / m
+        f_mech = self.braking.max_f * float(self.braking.brake_efficiency())
+        decel = minimum(f_mech / mass, mu * g * cos_s) - g * sin_s
+        if decel.lo <= 0:
+            return -math.inf  # runaway is possible somewhere in the box
+        stop = v_sq / (2 * decel + 1e-6)
+        return distance.lo - stop.hi
+
+    def _friction(self, lat_accel, mu, cos_s, mass, cog, accel, g):
+        # Mass cancels in utilization while the rear axle stays loaded:
+        # util = sqrt(lat^2 + a^2) / (2 * (g/2 - |a|*h/wb) * mu*cos)
+        cog_z = cog[2]
+        per_mass_grip = (g / 2 - accel.abs() * (cog_z / self.robot.wb)) * (mu * cos_s)
+        if lat_accel is None:
+            return {"grip_margin": -math.inf, "slip_margin_rad": -math.inf}
+        slip = mass * lat_accel.abs() / (self.tire.ca + 1e-6)
+        slip_margin = 0.21 - slip.hi
+
+        if per_mass_grip.lo <= 0:
+            return {"grip_margin": -math.inf, "slip_margin_rad": slip_margin}
+
+        demand = (lat_accel.sqr() + accel.sqr()).sqrt()
+        utilization = demand / (2 * per_mass_grip)
+        return {"grip_margin": 1.0 - utilization.hi, "slip_margin_rad": slip_margin}
+
+    def _stability(self, v_sq, lat_accel, cos_s, mass, cog, accel, bump, radius, g):
+        r = self.robot
+        cog_x, cog_y, cog_z = cog
+        downforce = 0.5 * r.rho * r.area * 0.3 * v_sq
+        weight = mass * g + downforce
+
+        # Roll: 1 - (overturning + damping) / restoring > 0.1, on every side the turn may load
+        widths = []
+        if radius.hi > 0:
+            widths.append(r.tw / 2 - cog_y)
+        if radius.lo <= 0:
+            widths.append(r.tw / 2 + cog_y)
+        if lat_accel is None or any(width.lo <= 0 for width in widths):
+            roll_margin = -math.inf  # unbounded turn, or the CoG may sit past a wheel
+        else:
+            overturning = mass * lat_accel * cog_z + r.c * bump * cog_z
+            roll_margin = min(
+                (1.0 - overturning / (weight * width * cos_s)).lo - 0.1 for width in widths
+            )
+
+        # Pitch: front load share above 5%
+        front_share = ((r.wb / 2) - cog_x) / r.wb - (mass * accel * (cog_z / r.wb)) / weight
+        front_margin = (front_share * 100).lo - 5.0
+
+        return {"stability_margin": roll_margin, "front_load_margin_pct": front_margin}
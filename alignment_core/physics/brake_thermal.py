@@ -0,0 +1,84 @@
+# FILE: alignment_core/physics/brake_thermal.py
+import numpy as np
+
+
+class BrakeThermalSimulator:
+    def __init__(self, braking_kernel, mass, cooling_power_w=2000.0, resistive_force_n=0.0):
+        """
+        Route-level brake heat integration for long descents.
+        braking_kernel: BrakingKernel supplying max_f, thermal_limit and fade.
+        mass: vehicle mass (kg).
+        cooling_power_w: heat the brakes shed per second while warm.
+        resistive_force_n: rolling/aero drag that brakes for free.
+        """
+        self.braking = braking_kernel
+        self.mass = mass
+        self.cooling_power_w = cooling_power_w
+        self.resistive_force_n = resistive_force_n
+        self.g = braking_kernel.g
+
+    def simulate(self, dist_array, elevation_array, speed_array, friction_array=None, initial_heat=None):
+        """
+        Integrates brake heat over a route given PathAuditor-style per-point
+        distance, elevation and planned speed arrays. Each segment adds the
+        potential and kinetic energy the brakes must absorb and sheds heat
+        for the time spent on it; heat never drops below zero, which makes
+        the recursion a Lindley process solved with cumulative sums.
+        Reports, per segment, the faded braking force against the force the
+        descent requires, and where it falls short.
+        """
+        dist = np.asarray(dist_array, dtype=float)
+        elevation = np.asarray(elevation_array, dtype=float)
+        speed = np.asarray(speed_array, dtype=float)
+        if initial_heat is None:
+            initial_heat = self.braking.current_heat_joules
+
+        # 1. SEGMENT GEOMETRY AND TIMING
+        ds = np.diff(dist)
+        drop = -np.diff(elevation)
+        slope = np.arctan2(drop, ds)  # + is downhill, as in BrakingKernel
+        mean_speed = np.maximum((speed[:-1] + speed[1:]) / 2, 1e-3)
+        dt = ds / mean_speed
+
+        # 2. REQUIRED BRAKING FORCE: gravity along the slope plus the planned
+        # deceleration, minus what drag already provides
+        planned_decel = (speed[:-1]**2 - speed[1:]**2) / (2 * ds)
+        required_f = np.maximum(
+            self.mass * (self.g * np.sin(slope) + planned_decel) - self.resistive_force_n, 0.0
+        )
+
+        # 3. HEAT: H_i = max(0, H_{i-1} + work_i - cooling_i), solved as
+        # H_n = S_n - min(-H_0, min_{k<=n} S_k) with S the running sum
+        increments = required_f * ds - self.cooling_power_w * dt
+        running = np.cumsum(increments)
+        heat = running - np.minimum(-initial_heat, np.minimum.accumulate(running))
+
+        # 4. FADE vs DEMAND (heat at the end of each segment: the hotter end)
+        efficiency = self.braking.brake_efficiency(heat)
+        available_f = self.braking.max_f * efficiency
+        if friction_array is not None:
+            mu = np.asarray(friction_array, dtype=float)[:-1]
+            available_f = np.minimum(available_f, mu * self.mass * self.g * np.cos(slope))
+        shortfall = required_f > available_f
+
+        return {
+            "distance_m": dist[:-1],
+            "slope_deg": np.degrees(slope),
+            "heat_j": heat,
+            "brake_fade_pct": (1 - efficiency) * 100,
+            "required_force_n": required_f,
+            "available_force_n": available_f,
+            "shortfall": shortfall,
+            "shortfall_intervals": self._intervals(shortfall, dist),
+            "first_shortfall_m": float(dist[np.argmax(shortfall)]) if shortfall.any() else None,
+            "peak_heat_j": float(heat.max()) if heat.size else float(initial_heat),
+            "final_heat_j": float(heat[-1]) if heat.size else float(initial_heat)
+        }
+
+    @staticmethod
+    def _intervals(mask, dist):
+        # (start_m, end_m) of every run of consecutive failing segments
+        edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return [(float(dist[s]), float(dist[e])) for s, e in zip(starts, ends)]
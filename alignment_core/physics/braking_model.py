@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 class BrakingModel:
     def __init__(self, friction=0.9, gravity=9.81):
@@ -19,31 +20,64 @@ class BrakingModel:
     def simulate_braking(self, velocity, dt=0.05):
 
         a = self.max_deceleration()
-
-        v = velocity
-        pos = 0
-
-        timeline = []
-
-        while v > 0:
-
-            v = max(0, v - a * dt)
-
-            pos += v * dt
-
-            timeline.append({
-                "velocity": v,
-                "position": pos,
-                "acceleration": -a
-            })
-
-        return timeline
+        trajectory = braking_trajectories(velocity, a, dt)
+
+        return [
+            {"velocity": float(v), "position": float(p), "acceleration": -a}
+            for v, p in zip(trajectory["velocity"], trajectory["position"])
+        ]
+
+    def trajectories(self, velocities, dt=0.05, summary_only=False):
+        """Many braking trajectories at once; see braking_trajectories()."""
+        return braking_trajectories(velocities, self.max_deceleration(), dt, summary_only)
+
+
+def braking_trajectories(velocity, deceleration, dt=0.05, summary_only=False):
+    """
+    Closed-form replacement for the step-by-step braking loops
+    (v = max(0, v - a*dt); position += v*dt, until v reaches 0).
+    velocity and deceleration may be broadcastable arrays of initial
+    speeds and constant decelerations.
+
+    The stop step is n = ceil(v0 / (a*dt)) and the final position the
+    arithmetic series dt * sum_{k<n} (v0 - k*a*dt), so summary_only
+    returns steps, stop_time and final_position without any trajectory.
+    Otherwise 'velocity' and 'position' have shape (..., max_steps), one
+    row per trajectory, held at 0 speed / final position after its stop.
+    """
+    v0, a = np.broadcast_arrays(np.asarray(velocity, dtype=float), np.asarray(deceleration, dtype=float))
+    moving = v0 > 0
+    if np.any(moving & (a <= 0)):
+        raise ValueError("Non-positive deceleration never stops a moving vehicle")
+
+    # 1. STOP STEP AND FINAL POSITION (analytic)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        steps = np.where(moving, np.ceil(v0 / (a * dt)), 0).astype(int)
+    k = np.maximum(steps - 1, 0)
+    summary = {
+        "steps": steps,
+        "stop_time": steps * dt,
+        "final_position": dt * (k * v0 - a * dt * k * (k + 1) / 2)
+    }
+    if summary_only:
+        return summary
+
+    # 2. TRAJECTORIES: every step of every run in one broadcast
+    t = np.arange(1, int(steps.max(initial=0)) + 1) * dt
+    velocities = np.maximum(0.0, v0[..., None] - a[..., None] * t)
+    positions = np.cumsum(velocities * dt, axis=-1)
+    return {**summary, "velocity": velocities, "position": positions}
 
 
 class BrakingConstraint:
 
     name = "BrakingFeasibility"
     severity = "hard"
+    reads = (
+        "agent.velocity",
+        "environment.distance_to_obstacles",
+        "environment.surface_friction"
+    )
 
     def evaluate(self, world_state):
 
@@ -62,4 +96,22 @@ class BrakingConstraint:
             "safe": not violated,
             "required_distance": stop_dist,
             "available_distance": dist
-        }]
\ No newline at end of file
+        }]
+
+    def evaluate_batch(self, world_state, velocities):
+        """Same check for an array of candidate velocities; world_state is only read."""
+
+        v = np.asarray(velocities, dtype=float)
+        dist = world_state.environment.distance_to_obstacles
+        mu = world_state.environment.surface_friction
+
+        a = mu * 9.81
+
+        stop_dist = (v**2)/(2*a)
+
+        return [{
+            "constraint": self.name,
+            "safe": stop_dist <= dist,
+            "required_distance": stop_dist,
+            "available_distance": dist
+        }]
@@ -1,3 +1,4 @@
+import numpy as np
 from ..world_model.primitives import Vector3
 # FILE: alignment_core/physics/mechanics.py
 class RigidBody:
@@ -69,6 +70,20 @@ def calculate_dynamic_normal_forces(mass, acceleration, com_height, wheelbase):
     
     return max(0, front_n), max(0, rear_n)
 
+def calculate_dynamic_normal_force_arrays(mass, acceleration, com_height, wheelbase):
+    """
+    Array form of calculate_dynamic_normal_forces for whole trajectories.
+    Inputs are broadcast together; returns (front_n, rear_n) arrays.
+    """
+    g = 9.81
+    static_weight = (np.asarray(mass, dtype=float) * g) / 2
+    transfer = (mass * np.abs(acceleration) * com_height) / wheelbase
+
+    front_n = static_weight + transfer
+    rear_n = static_weight - transfer
+
+    return np.maximum(0, front_n), np.maximum(0, rear_n)
+
 def calculate_auto_cog(chassis_mass, chassis_h, battery_mass, battery_h, load_mass, load_h):
     """Calculates composite CoG height by summing mass moments."""
     total_mass = chassis_mass + battery_mass + load_mass
@@ -86,4 +101,60 @@ def get_support_polygon(wheelbase, track_width, num_wheels=4):
     return [
         Vector3(0, -track_width/2, 0), Vector3(wheelbase, -track_width/2, 0),
         Vector3(wheelbase, track_width/2, 0), Vector3(0, track_width/2, 0)
-    ]
\ No newline at end of file
+    ]
+
+def support_polygon_array(wheelbase, track_width, num_wheels=4):
+    """
+    get_support_polygon() as a (num_vertices, 2) array of (x, y) ground
+    contacts, normalized to counter-clockwise order (the 3-wheel layout
+    is listed clockwise).
+    """
+    vertices = np.array([(p.x, p.y) for p in get_support_polygon(wheelbase, track_width, num_wheels)], dtype=float)
+    x, y = vertices[:, 0], vertices[:, 1]
+    signed_area = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+    return vertices if signed_area > 0 else vertices[::-1]
+
+def calculate_zmp_margin(acceleration, yaw_rate, velocity, slope_deg, cog_x, cog_y, cog_z,
+                         wheelbase, track_width, num_wheels=4, g=9.81):
+    """
+    Zero-moment point of every trajectory sample against the support polygon.
+    acceleration (longitudinal, m/s^2), yaw_rate (rad/s, + turns toward +y),
+    velocity (m/s) and slope_deg (+ is downhill) are per-sample arrays or
+    scalars. cog_x/cog_y are offsets from the vehicle center as in RigidBody
+    (+x forward, +y right), cog_z the composite height (calculate_auto_cog).
+
+    Returns the ZMP coordinates in the polygon frame (rear axle at x = 0),
+    the signed distance to the nearest polygon edge (> 0 inside; exact
+    inside, a lower bound on the depth outside), and the worst sample.
+    """
+    acceleration, yaw_rate, velocity, slope_deg = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=float)) for x in (acceleration, yaw_rate, velocity, slope_deg))
+    )
+    slope_rad = np.radians(slope_deg)
+    normal_g = g * np.cos(slope_rad)
+
+    # 1. Effective field on the CoG: gravity minus the vehicle's acceleration
+    # (lateral acceleration of a turn is v * yaw_rate)
+    forward = g * np.sin(slope_rad) - acceleration
+    lateral = -velocity * yaw_rate
+
+    # 2. ZMP: project the CoG along that field onto the ground plane
+    zmp_x = (wheelbase / 2 + cog_x) + cog_z * forward / normal_g
+    zmp_y = cog_y + cog_z * lateral / normal_g
+
+    # 3. Distance to every edge along its inward normal (CCW polygon: left side)
+    vertices = support_polygon_array(wheelbase, track_width, num_wheels)
+    edges = np.roll(vertices, -1, axis=0) - vertices
+    inward = np.stack([-edges[:, 1], edges[:, 0]], axis=1) / np.linalg.norm(edges, axis=1)[:, None]
+    points = np.stack([zmp_x, zmp_y], axis=-1)
+    edge_distance = np.einsum("...ek,ek->...e", points[..., None, :] - vertices, inward).min(axis=-1)
+
+    worst = int(np.argmin(edge_distance))
+    return {
+        "zmp_x": zmp_x,
+        "zmp_y": zmp_y,
+        "edge_distance": edge_distance,
+        "min_distance": float(edge_distance.flat[worst]),
+        "critical_index": worst,
+        "is_stable": bool(edge_distance.flat[worst] > 0)
+    }
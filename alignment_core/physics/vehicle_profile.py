@@ -0,0 +1,104 @@
+# FILE: alignment_core/physics/vehicle_profile.py
+import hashlib
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+# Inputs of a profile; everything else is derived from them
+INPUT_FIELDS = ("m", "tw", "wb", "cog_z", "cog_x", "cog_y", "k", "c", "area", "max_f_brake", "g", "rho")
+
+
+@dataclass(frozen=True, eq=False)
+class VehicleProfile:
+    """
+    Immutable vehicle description. Attribute names match RigidBody, so a
+    profile can stand in for a body anywhere; the derived constants the
+    kernels need are computed once here. Fields may also be NumPy arrays
+    (one profile describing many load cases) as long as they broadcast.
+    """
+    m: float                   # kg
+    tw: float                  # m, track width
+    wb: float                  # m, wheelbase
+    cog_z: float               # m, CoG height
+    cog_x: float = 0.0         # m, + is forward
+    cog_y: float = 0.0         # m, + is right
+    k: float = 25000           # N/m, suspension
+    c: float = 1500            # Ns/m, damping
+    area: float = 0.5          # m^2, frontal area
+    max_f_brake: float = 500   # N
+    g: float = 9.81
+    rho: float = 1.225         # kg/m^3, air density
+
+    # Derived constants
+    weight: float = field(init=False, repr=False)
+    dist_to_right: float = field(init=False, repr=False)
+    dist_to_left: float = field(init=False, repr=False)
+    dist_to_front: float = field(init=False, repr=False)
+    front_share: float = field(init=False, repr=False)
+    k_aero: float = field(init=False, repr=False)
+    transfer_per_accel: float = field(init=False, repr=False)
+    cache_key: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        derived = {
+            "weight": self.m * self.g,
+            "dist_to_right": (self.tw / 2) - self.cog_y,
+            "dist_to_left": (self.tw / 2) + self.cog_y,
+            "dist_to_front": (self.wb / 2) - self.cog_x,
+            "front_share": ((self.wb / 2) - self.cog_x) / self.wb,
+            # Downforce per v^2 (Cl_area = 0.3)
+            "k_aero": 0.5 * self.rho * self.area * 0.3,
+            # Axle load transfer per m/s^2 of longitudinal acceleration
+            "transfer_per_accel": (self.m * self.cog_z) / self.wb,
+            "cache_key": self._digest()
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def of(cls, body):
+        """Returns body if it is already a profile, else a snapshot of a RigidBody."""
+        if isinstance(body, cls):
+            return body
+        return cls(
+            m=body.m, tw=body.tw, wb=body.wb, cog_z=body.cog_z,
+            cog_x=body.cog_x, cog_y=body.cog_y, k=body.k, c=body.c, area=body.area,
+            max_f_brake=getattr(body, "max_f_brake", 500), g=body.g, rho=body.rho
+        )
+
+    def with_payload(self, payload_mass, p_x, p_y, p_z):
+        """
+        New profile carrying a payload at (p_x, p_y, p_z) relative to the
+        robot center; mass and CoG become the combined mass moments.
+        """
+        total_mass = self.m + payload_mass
+        return replace(
+            self,
+            m=total_mass,
+            cog_x=((self.m * self.cog_x) + (payload_mass * p_x)) / total_mass,
+            cog_y=((self.m * self.cog_y) + (payload_mass * p_y)) / total_mass,
+            cog_z=((self.m * self.cog_z) + (payload_mass * p_z)) / total_mass
+        )
+
+    def with_changes(self, **changes):
+        """New profile with some inputs replaced (e.g. max_f_brake=2500)."""
+        return replace(self, **changes)
+
+    def inputs(self):
+        return {name: getattr(self, name) for name in INPUT_FIELDS}
+
+    def __eq__(self, other):
+        return isinstance(other, VehicleProfile) and self.cache_key == other.cache_key
+
+    def __hash__(self):
+        return hash(self.cache_key)
+
+    def _digest(self):
+        # Content hash, stable across processes (unlike hash()), array-safe
+        digest = hashlib.sha256()
+        for name in INPUT_FIELDS:
+            value = np.ascontiguousarray(getattr(self, name), dtype=float)
+            digest.update(f"{name}{value.shape}".encode())
+            digest.update(value.tobytes())
+        return digest.hexdigest()[:16]
+
@@ -22,4 +22,58 @@ class ActionOptimizer:
             if violations:
                 return v - 0.2
 
-        return max_velocity
\ No newline at end of file
+        return max_velocity
+
+
+    def find_safe_velocity_batched(self, world_state, max_velocity=15, samples=50, tolerance=0.01):
+        """
+        Batched version of find_safe_velocity(). All candidates go through one
+        engine.evaluate_batch() call, then the bracket around the first
+        violation is subdivided with further batched calls until it is
+        narrower than `tolerance`. world_state is never mutated.
+        Returns the highest velocity verified safe and the number of engine calls.
+        """
+
+        evaluations = 0
+
+        candidates = np.linspace(0.1, max_velocity, samples)
+        safe = self._safe_mask(world_state, candidates)
+        evaluations += 1
+
+        if safe.all():
+            return {"max_safe_velocity": float(max_velocity), "engine_evaluations": evaluations}
+
+        first_unsafe = int(np.argmin(safe))
+        if first_unsafe == 0:
+            return {"max_safe_velocity": 0.0, "engine_evaluations": evaluations}
+
+        low, high = candidates[first_unsafe - 1], candidates[first_unsafe]
+
+        while high - low > tolerance:
+
+            inner = np.linspace(low, high, samples + 2)[1:-1]
+            safe = self._safe_mask(world_state, inner)
+            evaluations += 1
+
+            if safe.all():
+                low = inner[-1]
+                continue
+
+            first_unsafe = int(np.argmin(safe))
+            high = inner[first_unsafe]
+            if first_unsafe > 0:
+                low = inner[first_unsafe - 1]
+
+        return {"max_safe_velocity": float(low), "engine_evaluations": evaluations}
+
+
+    def _safe_mask(self, world_state, velocities):
+
+        results = self.engine.evaluate_batch(world_state, velocities)
+
+        safe = np.ones(len(velocities), dtype=bool)
+
+        for r in results:
+            safe &= np.asarray(r["safe"], dtype=bool)
+
+        return safe
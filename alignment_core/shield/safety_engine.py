@@ -0,0 +1,67 @@
+import copy
+import numpy as np
+
+from ..world_model.world_state import WorldState
+
+
+class SafetyEngine:
+
+    def __init__(self, constraints=None):
+        """
+        constraints: objects with evaluate(world_state) returning a list of
+        result dicts ({"constraint", "safe", ...}). Constraints may also offer
+        evaluate_batch(world_state, velocities) for the batched path.
+        """
+        self.constraints = list(constraints or [])
+
+
+    def evaluate(self, world_state):
+
+        results = []
+
+        for constraint in self.constraints:
+            results.extend(constraint.evaluate(world_state))
+
+        return results
+
+
+    def evaluate_batch(self, world_state, velocities):
+        """
+        Evaluates every constraint at each candidate agent velocity in one
+        call, without mutating world_state. Returns the same result dicts as
+        evaluate(), with per-velocity arrays in place of scalar fields.
+        """
+        velocities = np.asarray(velocities, dtype=float)
+
+        results = []
+
+        for constraint in self.constraints:
+
+            if hasattr(constraint, "evaluate_batch"):
+                results.extend(constraint.evaluate_batch(world_state, velocities))
+            else:
+                results.extend(self._evaluate_each(constraint, world_state, velocities))
+
+        return results
+
+
+    def _evaluate_each(self, constraint, world_state, velocities):
+
+        # Fallback for scalar-only constraints: evaluate on a private copy of the agent
+        agent = copy.copy(world_state.agent)
+        state = WorldState(agent=agent, environment=world_state.environment, action=world_state.action)
+
+        per_velocity = []
+        for v in velocities:
+            agent.velocity = v
+            per_velocity.append(constraint.evaluate(state))
+
+        stacked = []
+        for i, first in enumerate(per_velocity[0] if per_velocity else []):
+            merged = {"constraint": first["constraint"]}
+            for key in first:
+                if key != "constraint":
+                    merged[key] = np.array([results[i][key] for results in per_velocity])
+            stacked.append(merged)
+
+        return stacked
@@ -1,12 +1,27 @@
+from functools import reduce
+
+
 class SafetyShield:
 
-    def __init__(self, safety_engine):
+    def __init__(self, safety_engine, force_full_evaluation=False):
+        """
+        Constraints that declare `reads` are only re-evaluated when one of
+        those WorldState fields changed since their last evaluation; the
+        cached verdict is reused otherwise. force_full_evaluation (or
+        intercept(..., force_full=True)) disables reuse, e.g. for audits.
+        """
         self.engine = safety_engine
+        self.force_full_evaluation = force_full_evaluation
+
+        self._cache = {}
+
+        self.evaluated = 0
+        self.reused = 0
 
 
-    def intercept(self, world_state, action):
+    def intercept(self, world_state, action, force_full=False):
 
-        results = self.engine.evaluate(world_state)
+        results = self._evaluate(world_state, force_full or self.force_full_evaluation)
 
         violations = [r for r in results if not r["safe"]]
 
@@ -20,4 +35,60 @@ class SafetyShield:
         return {
             "approved": True,
             "violations": []
-        }
\ No newline at end of file
+        }
+
+
+    def metrics(self):
+
+        total = self.evaluated + self.reused
+
+        return {
+            "evaluated": self.evaluated,
+            "reused": self.reused,
+            "reuse_rate": round(self.reused / total, 3) if total else 0.0
+        }
+
+
+    def invalidate(self):
+
+        self._cache.clear()
+
+
+    def _evaluate(self, world_state, full):
+
+        constraints = getattr(self.engine, "constraints", None)
+
+        # Engines that don't expose their constraints are always run whole
+        if constraints is None:
+            self.evaluated += 1
+            return self.engine.evaluate(world_state)
+
+        results = []
+
+        for constraint in constraints:
+
+            fingerprint = self._fingerprint(constraint, world_state)
+            cached = self._cache.get(constraint)
+
+            if not full and fingerprint is not None and cached is not None and cached[0] == fingerprint:
+                self.reused += 1
+                results.extend(cached[1])
+                continue
+
+            constraint_results = constraint.evaluate(world_state)
+            self._cache[constraint] = (fingerprint, constraint_results)
+            self.evaluated += 1
+            results.extend(constraint_results)
+
+        return results
+
+
+    @staticmethod
+    def _fingerprint(constraint, world_state):
+
+        reads = getattr(constraint, "reads", None)
+
+        if reads is None:
+            return None
+
+        return tuple(reduce(getattr, path.split("."), world_state) for path in reads)
@@ -3,6 +3,14 @@ import json
 import time
 from datetime import datetime
 
+def _to_json(obj):
+    # Kernel result records serialize through their legacy dict view
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class TelemetryLogger:
     def __init__(self, log_to_file=True):
         self.log_to_file = log_to_file
@@ -31,4 +39,4 @@ class TelemetryLogger:
 
         if self.log_to_file:
             with open(self.log_path, "a") as f:
-                f.write(json.dumps(telemetry_frame) + "\n")
\ No newline at end of file
+                f.write(json.dumps(telemetry_frame, default=_to_json) + "\n")
\ No newline at end of file
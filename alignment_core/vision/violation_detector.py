@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class ViolationDetector:
 
     def __init__(self, safety_engine):
@@ -23,4 +26,64 @@ class ViolationDetector:
                         "constraint": r["constraint"]
                     })
 
-        return violations
\ No newline at end of file
+        return violations
+
+    def analyze_batch(self, world_state, velocities, frame_offset=0):
+        """
+        Audits a whole velocity trace in one engine.evaluate_batch() call and
+        returns contiguous violation intervals per constraint instead of one
+        entry per sample. Severity is required/available distance when the
+        constraint reports them, otherwise 1.0 for every violating sample.
+        frame_offset: frame number of the first velocity sample.
+        """
+
+        velocities = np.asarray(velocities, dtype=float)
+
+        if velocities.size == 0:
+            return []
+
+        results = self.engine.evaluate_batch(world_state, velocities)
+
+        intervals = []
+
+        for r in results:
+
+            unsafe = ~np.broadcast_to(np.asarray(r["safe"], dtype=bool), velocities.shape)
+
+            if not unsafe.any():
+                continue
+
+            severity = self._severity(r, velocities.shape)
+
+            # Run boundaries of the violation mask
+            edges = np.diff(np.concatenate(([0], unsafe.astype(np.int8), [0])))
+            starts = np.flatnonzero(edges == 1)
+            ends = np.flatnonzero(edges == -1)
+
+            # Peak severity per run; the appended sentinel keeps every index in range
+            padded = np.append(severity, -np.inf)
+            peaks = np.maximum.reduceat(padded, np.column_stack((starts, ends)).ravel())[::2]
+
+            for start, end, peak in zip(starts, ends, peaks):
+
+                intervals.append({
+                    "start_frame": int(start) + frame_offset,
+                    "end_frame": int(end) - 1 + frame_offset,
+                    "constraint": r["constraint"],
+                    "peak_severity": float(peak)
+                })
+
+        intervals.sort(key=lambda i: i["start_frame"])
+
+        return intervals
+
+
+    @staticmethod
+    def _severity(result, shape):
+
+        if "required_distance" in result and "available_distance" in result:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.asarray(result["required_distance"], dtype=float) / result["available_distance"]
+            return np.broadcast_to(ratio, shape)
+
+        return np.ones(shape)
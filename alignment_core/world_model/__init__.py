@@ -1,5 +1,6 @@
 from .world_state import WorldState
 from .agent import AgentState
 from .environment import EnvironmentState
+from .fleet import FleetStore
 
-__all__ = ["WorldState", "AgentState", "EnvironmentState"]
\ No newline at end of file
+__all__ = ["WorldState", "AgentState", "EnvironmentState", "FleetStore"]
\ No newline at end of file
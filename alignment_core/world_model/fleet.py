@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class FleetStore:
+    """
+    Columnar (structure-of-arrays) store of many agents and their local
+    environment. Columns are contiguous arrays with spare capacity, so
+    adding an agent is amortized O(1) and removal swaps in the last agent.
+    """
+
+    # column: default value (mirrors AgentState / EnvironmentState defaults;
+    # the kernel-only columns default to a centered CoG on a straight line)
+    COLUMNS = {
+        "mass": 0.0,
+        "wheelbase": 0.0,
+        "track_width": 1.6,
+        "cog_height": 0.0,
+        "cog_x": 0.0,
+        "cog_y": 0.0,
+        "cornering_stiffness": 15000.0,
+        "velocity": 0.0,
+        "radius": 0.0,
+        "acceleration": 0.0,
+        "max_speed": 0.0,
+        "load": 0.0,
+        "max_load": 0.0,
+        "max_braking_force": 500.0,
+        "friction": 0.8,
+        "slope": 0.0,
+        "obstacle_distance": 10.0,
+    }
+
+    def __init__(self, capacity=64):
+        self._size = 0
+        self._ids = []
+        self._index = {}
+        self._data = {name: np.full(capacity, default) for name, default in self.COLUMNS.items()}
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, agent_id):
+        return agent_id in self._index
+
+    @property
+    def ids(self):
+        return list(self._ids)
+
+    @property
+    def capacity(self):
+        return len(self._data["mass"])
+
+    def column(self, name):
+        """Live view of one column over the current agents."""
+        return self._data[name][:self._size]
+
+    def add(self, agent_id, **values):
+        if agent_id in self._index:
+            raise KeyError(f"Agent already in fleet: {agent_id}")
+        if self._size == self.capacity:
+            self._grow()
+
+        i = self._size
+        for name, default in self.COLUMNS.items():
+            self._data[name][i] = values.pop(name, default)
+        if values:
+            raise KeyError(f"Unknown fleet columns: {sorted(values)}")
+
+        self._ids.append(agent_id)
+        self._index[agent_id] = i
+        self._size += 1
+        return i
+
+    def add_world(self, world_state):
+        """Adds the agent of a WorldBuilder-built WorldState."""
+        agent, env = world_state.agent, world_state.environment
+        return self.add(
+            agent.id,
+            mass=agent.mass,
+            wheelbase=agent.wheelbase,
+            cog_height=agent.center_of_mass_height,
+            velocity=agent.velocity,
+            max_speed=agent.max_speed,
+            load=agent.load_weight,
+            max_load=agent.max_load,
+            friction=env.surface_friction,
+            slope=env.slope,
+            obstacle_distance=env.distance_to_obstacles
+        )
+
+    def update(self, agent_id, **values):
+        i = self._index[agent_id]
+        for name, value in values.items():
+            self._data[name][i] = value
+
+    def remove(self, agent_id):
+        """Removes an agent by moving the last agent into its slot."""
+        i = self._index.pop(agent_id)
+        last = self._size - 1
+        if i != last:
+            for column in self._data.values():
+                column[i] = column[last]
+            moved = self._ids[last]
+            self._ids[i] = moved
+            self._index[moved] = i
+        self._ids.pop()
+        self._size -= 1
+
+    def _grow(self):
+        new_capacity = max(2 * self.capacity, 1)
+        for name, column in self._data.items():
+            grown = np.full(new_capacity, self.COLUMNS[name])
+            grown[:self._size] = column[:self._size]
+            self._data[name] = grown
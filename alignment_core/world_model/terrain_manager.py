@@ -1,6 +1,22 @@
+# Nominal (static, kinetic) friction coefficients per surface type
+SURFACE_FRICTION = {
+    "dry_asphalt": (0.9, 0.7),
+    "wet_asphalt": (0.6, 0.45),
+    "gravel": (0.55, 0.4),
+    "snow": (0.3, 0.2),
+    "ice": (0.1, 0.05),
+}
+
+
 class TerrainManager:
     def __init__(self, default_surface="dry_asphalt"):
         self.default_surface = default_surface
+        # Trust factor on the nominal friction, lowered by FrictionObserver on slip
+        self.safety_margin = 1.0
 
     def get_surface(self, position=None):
-        return self.default_surface
\ No newline at end of file
+        return self.default_surface
+
+    def get_friction(self, position=None):
+        mu_s, mu_k = SURFACE_FRICTION[self.get_surface(position)]
+        return mu_s * self.safety_margin, mu_k * self.safety_margin
@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass
 
 
@@ -6,4 +7,14 @@ class UncertaintyModel:
     position_variance: float
     velocity_variance: float
     friction_variance: float
-    sensor_noise_level: float
\ No newline at end of file
+    sensor_noise_level: float
+
+    def velocity_bounds(self, velocity, k_sigma=3.0):
+        """(lo, hi) velocity interval of +/- k_sigma standard deviations."""
+        spread = k_sigma * math.sqrt(self.velocity_variance)
+        return velocity - spread, velocity + spread
+
+    def friction_bounds(self, friction, k_sigma=3.0):
+        """(lo, hi) friction interval of +/- k_sigma standard deviations."""
+        spread = k_sigma * math.sqrt(self.friction_variance)
+        return friction - spread, friction + spread
@@ -1,7 +1,19 @@
+from alignment_core.physics.vehicle_profile import VehicleProfile
+
+# Vehicle model the safety predictor audits against
+VEHICLE_PROFILE = VehicleProfile(
+    m=2200,
+    tw=1.6,
+    wb=2.9,
+    cog_z=0.55,
+    max_f_brake=3000
+)
+CORNERING_STIFFNESS = 40000
+
 MAX_SPEED = 20.0
 MAX_STEER = 0.6
 
 WHEELBASE = 3.2
 TRACK_WIDTH = 1.8
 
-SAFE_DISTANCE = 5.0
\ No newline at end of file
+SAFE_DISTANCE = 5.0
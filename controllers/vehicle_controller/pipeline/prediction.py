@@ -1,33 +1,86 @@
+import numpy as np
+
 from alignment_core.decision.predictive_kernel import PredictiveKernel
+from alignment_core.decision.safe_speed_table import SafeSpeedTable
 from alignment_core.decision.action_auditor import ActionAuditor
 from alignment_core.constraints.stability import StabilityKernel
 from alignment_core.constraints.friction import FrictionKernel
 from alignment_core.constraints.braking import BrakingKernel
 from alignment_core.constraints.load import LoadKernel
-from alignment_core.physics.mechanics import RigidBody, TireModel
+from alignment_core.physics.mechanics import TireModel
 from alignment_core.world_model.terrain_manager import TerrainManager
+from config import VEHICLE_PROFILE, CORNERING_STIFFNESS
 
 
 class Predictor:
-    def __init__(self):
-        body = RigidBody(2200, 1.6, 2.9, 0.55)
-        tires = TireModel(40000)
-        terrain = TerrainManager(default_surface="dry_asphalt")
+    def __init__(self, use_table=False, profile=VEHICLE_PROFILE):
+        self.body = profile
+        tires = TireModel(CORNERING_STIFFNESS)
+        self.terrain = TerrainManager(default_surface="dry_asphalt")
+
+        self.stability = StabilityKernel(self.body)
+        self.friction = FrictionKernel(self.body, tires, self.terrain)
+        self.braking = BrakingKernel(max_braking_force=profile.max_f_brake)
+        self.load = LoadKernel(self.body)
 
         auditor = ActionAuditor(
-            robot=body,
-            stability=StabilityKernel(body),
-            friction=FrictionKernel(body, tires, terrain),
-            braking=BrakingKernel(max_braking_force=3000),
-            load=LoadKernel(body)
+            robot=self.body,
+            stability=self.stability,
+            friction=self.friction,
+            braking=self.braking,
+            load=self.load
         )
 
         self.kernel = PredictiveKernel(auditor)
 
-    def get_safe_speed(self, radius):
+        # Table mode: precompute the limit once, rebuilt whenever the vehicle
+        # profile (e.g. via set_payload) or brake heat changes
+        self.table = None
+        if use_table:
+            self.table = SafeSpeedTable(
+                self.kernel,
+                radii=np.geomspace(2.0, 1000.0, 48),
+                slopes=np.linspace(-15.0, 15.0, 13),
+                surface_mus=np.linspace(0.1, 1.0, 10),
+                distances=np.geomspace(0.5, 100.0, 40)
+            )
+            print("[Prediction] Safe-speed table:", self.table.stats())
+
+    def rebind(self, profile):
+        """Switches every kernel to a new VehicleProfile; cached speeds go stale."""
+        self.body = profile
+        self.kernel.auditor.rebind(profile)
+
+    def set_payload(self, payload_mass, p_x, p_y, p_z):
+        """Loads the vehicle via LoadKernel and rebinds the kernels to the result."""
+        result = self.load.update_payload(payload_mass, p_x, p_y, p_z)
+        self.rebind(result["profile"])
+        return result
+
+    def model_key(self):
+        """Everything a cached safe speed depends on besides the query itself."""
+        return (
+            self.body.cache_key,
+            self.braking.current_heat_joules,
+            self.terrain.get_surface(), self.terrain.safety_margin
+        )
+
+    def safe_speed(self, radius, slope=0, dist_to_obj=100):
+        """The solved safe speed; unlike get_safe_speed(), errors propagate."""
+        if self.table is not None:
+            if self.table.is_stale():
+                self.table.build()
+                print("[Prediction] Safe-speed table rebuilt:", self.table.stats())
+            safe_v = self.table.lookup(radius, slope, self.terrain.get_friction()[0], dist_to_obj)
+            if safe_v is not None:
+                return safe_v
+
+        result = self.kernel.find_optimal_velocity(radius, slope=slope, dist_to_obj=dist_to_obj)
+        return result.get("max_safe_velocity", 8.0)
+
+    def get_safe_speed(self, radius, slope=0, dist_to_obj=100):
         try:
-            result = self.kernel.find_optimal_velocity(radius)
-            return result.get("max_safe_velocity", 8.0)
+            return self.safe_speed(radius, slope, dist_to_obj)
         except Exception as e:
             print("[Prediction Error]:", e)
-            return 6.0
\ No newline at end of file
+            return 6.0
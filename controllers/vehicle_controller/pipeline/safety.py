@@ -1,19 +1,22 @@
 import math
 
+from alignment_core.decision.speed_cache import SafeSpeedCache
+
 class SafetySystem:
-    def __init__(self, predictor):
+    def __init__(self, predictor, cache_size=256):
         self.predictor = predictor
+        self.speed_cache = SafeSpeedCache(predictor, maxsize=cache_size)
 
     def enforce(self, action):
         v = action["speed"]
         steer = action["steering"]
 
         if abs(steer) > 0.01:
-            radius = 2.9 / math.tan(abs(steer))
+            radius = self.predictor.body.wb / math.tan(abs(steer))
         else:
             radius = 999.0
 
-        safe_v = self.predictor.get_safe_speed(radius)
+        safe_v = self.speed_cache.get_safe_speed(radius)
 
         v = min(v, safe_v)
 
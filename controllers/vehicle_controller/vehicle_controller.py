@@ -22,10 +22,10 @@ def main():
 
     adapter = WebotsAdapter(robot, timestep)
     perception_unit = Perception()
-    predictor = Predictor()
+    predictor = Predictor(use_table=True)
     
     auditor = ActionAuditor(
-        robot=robot,
+        robot=predictor.body,
         stability=getattr(predictor, 'stability', None),
         friction=getattr(predictor, 'friction', None),
         braking=getattr(predictor, 'braking', None),
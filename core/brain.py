@@ -3,6 +3,7 @@ from core.perception import Perception
 from core.mapping import OccupancyGrid
 from core.planning import Planner
 from core.behavior import Behavior
+from alignment_core.decision.speed_cache import SafeSpeedCache
 
 
 class Brain:
@@ -12,6 +13,7 @@ class Brain:
         self.planner = Planner()
         self.behavior = Behavior()
         self.predictor = predictor
+        self.speed_cache = SafeSpeedCache(predictor)
 
     def step(self, sensor_data):
         state = self.perception.update(sensor_data)
@@ -44,7 +46,7 @@ class Brain:
             radius = 999.0
 
         try:
-            safe_v = self.predictor.get_safe_speed(radius)
+            safe_v = self.speed_cache.get_safe_speed(radius)
         except Exception as e:
             print("[Safety Error]:", e)
             safe_v = 6.0
@@ -0,0 +1,67 @@
+"""
+Error versus sample count for each sampling strategy on the braking
+collision scenario of monte_carlo_collision_test().
+
+    python -m simulation.benchmark_sampling
+"""
+import time
+
+import numpy as np
+
+from simulation.monte_carlo import quadrature_collision_probability, sampled_collision_probability
+from simulation.samplers import SAMPLERS
+
+SCENARIO = {
+    "speed": 15.0,
+    "friction": 0.7,
+    "brake_force": 20.0,
+    "obstacle_distance": 12.0,
+    "speed_spread": 0.1,
+    "distance_spread": 0.1,
+}
+
+
+def benchmark(sample_counts=(2**8, 2**10, 2**12, 2**14, 2**16), repeats=20, reference_points=512):
+    """
+    RMSE of the collision probability and mean overshoot over `repeats`
+    independently seeded (randomized) replicates per strategy and count,
+    against the deterministic quadrature reference (reference_points per
+    axis), which shares no points with any of the samplers.
+    """
+    reference = quadrature_collision_probability(points_per_axis=reference_points, **SCENARIO)
+
+    rows = []
+    for strategy in SAMPLERS:
+        for n in sample_counts:
+            start = time.perf_counter()
+            results = [
+                sampled_collision_probability(n, strategy=strategy, seed=seed, **SCENARIO)
+                for seed in range(repeats)
+            ]
+            elapsed = (time.perf_counter() - start) / repeats
+
+            probability = np.array([r["probability"] for r in results])
+            overshoot = np.array([r["mean_overshoot"] for r in results])
+            rows.append({
+                "strategy": strategy,
+                "runs": n,
+                "rmse_probability": float(np.sqrt(np.mean((probability - reference["probability"])**2))),
+                "rmse_overshoot": float(np.sqrt(np.mean((overshoot - reference["mean_overshoot"])**2))),
+                "seconds_per_estimate": elapsed
+            })
+    return reference, rows
+
+
+def main():
+    reference, rows = benchmark()
+    print(f"Reference: p={reference['probability']:.6f} (+/- {reference['probability_error_estimate']:.1e}), "
+          f"mean overshoot={reference['mean_overshoot']:.6f} m (+/- {reference['overshoot_error_estimate']:.1e}) "
+          f"({reference['points']} quadrature points)")
+    print(f"{'strategy':<16}{'runs':>8}{'rmse p':>12}{'rmse overshoot':>16}{'ms/estimate':>14}")
+    for row in rows:
+        print(f"{row['strategy']:<16}{row['runs']:>8}{row['rmse_probability']:>12.2e}"
+              f"{row['rmse_overshoot']:>16.2e}{row['seconds_per_estimate'] * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from alignment_core.constraints.braking import BrakingKernel
+from alignment_core.constraints.friction import FrictionKernel
+from alignment_core.constraints.stability import StabilityKernel
+from alignment_core.physics.mechanics import TireModel
+from alignment_core.physics.vehicle_profile import VehicleProfile
+
+# Sweepable design parameters and their defaults
+PARAMETERS = {
+    "mass": 2200.0,
+    "track_width": 1.6,
+    "wheelbase": 2.9,
+    "cog_z": 0.55,
+    "c_damping": 1500.0,
+    "cornering_stiffness": 40000.0,
+    "max_braking_force": 3000.0,
+}
+
+# Fixed operating point every design is audited at
+CONDITIONS = {
+    "velocity": 15.0,
+    "radius": 50.0,
+    "acceleration": 0.0,
+    "slope": 0.0,
+    "surface_mu": 0.8,
+    "distance": 40.0,
+    "bump_velocity": 0.0,
+}
+
+# Result columns: name -> dtype
+METRICS = {
+    "is_legal": "?",
+    "stability_legal": "?",
+    "friction_legal": "?",
+    "braking_legal": "?",
+    "stability_margin": "f8",
+    "front_load_pct": "f8",
+    "grip_utilization": "f8",
+    "slip_angle_deg": "f8",
+    "stopping_distance_m": "f8",
+    "max_safe_velocity": "f8",
+}
+
+
+def explore_design_space(ranges, output_dir, conditions=None, shard_size=65536, workers=None):
+    """
+    Audits the Cartesian product of design parameter values (see
+    PARAMETERS; unlisted ones keep their default) at one operating point.
+
+    The product is split into shards of shard_size points, evaluated with
+    the kernels' vectorized paths in a process pool, and written straight
+    into one .npy column per parameter and metric in output_dir, plus a
+    meta.json. Nothing larger than a shard is held in memory; reopen the
+    study with load_design_space(). workers=0 runs in-process.
+    """
+    unknown = set(ranges) - set(PARAMETERS)
+    if unknown:
+        raise KeyError(f"Unknown design parameters: {sorted(unknown)}")
+    conditions = {**CONDITIONS, **(conditions or {})}
+    axes = {
+        name: np.atleast_1d(np.asarray(ranges.get(name, default), dtype=float))
+        for name, default in PARAMETERS.items()
+    }
+    total = int(np.prod([len(a) for a in axes.values()]))
+
+    # 1. Preallocate the on-disk columns
+    os.makedirs(output_dir, exist_ok=True)
+    columns = {**{name: "f8" for name in PARAMETERS}, **METRICS}
+    for name, dtype in columns.items():
+        open_memmap(os.path.join(output_dir, f"{name}.npy"), mode="w+", dtype=dtype, shape=(total,)).flush()
+
+    # 2. Shard the product across the pool; workers write their own slices
+    start = time.perf_counter()
+    shards = [(lo, min(lo + shard_size, total)) for lo in range(0, total, shard_size)]
+    if workers == 0:
+        for lo, hi in shards:
+            _run_shard(output_dir, axes, conditions, lo, hi)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_shard, output_dir, axes, conditions, lo, hi) for lo, hi in shards]
+            for future in as_completed(futures):
+                future.result()
+    elapsed = time.perf_counter() - start
+
+    # 3. Metadata
+    meta = {
+        "points": total,
+        "shards": len(shards),
+        "elapsed_s": round(elapsed, 3),
+        "points_per_s": round(total / elapsed, 1) if elapsed > 0 else None,
+        "axes": {name: values.tolist() for name, values in axes.items()},
+        "conditions": conditions,
+        "columns": columns,
+    }
+    with open(os.path.join(output_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def load_design_space(output_dir, mmap=True):
+    """Reopens a study: (meta, {column: array}); columns are memory-mapped by default."""
+    with open(os.path.join(output_dir, "meta.json")) as f:
+        meta = json.load(f)
+    columns = {
+        name: np.load(os.path.join(output_dir, f"{name}.npy"), mmap_mode="r" if mmap else None)
+        for name in meta["columns"]
+    }
+    return meta, columns
+
+
+def _run_shard(output_dir, axes, conditions, lo, hi):
+    # 1. Decode the flat product indices into parameter values
+    index = np.unravel_index(np.arange(lo, hi), tuple(len(a) for a in axes.values()))
+    values = {name: axes[name][i] for name, i in zip(axes, index)}
+
+    # 2. One array-valued vehicle for the whole shard
+    body = VehicleProfile(
+        m=values["mass"], tw=values["track_width"], wb=values["wheelbase"], cog_z=values["cog_z"],
+        c=values["c_damping"], max_f_brake=values["max_braking_force"]
+    )
+    stability = StabilityKernel(body)
+    friction = FrictionKernel(body, TireModel(values["cornering_stiffness"]), terrain_manager=None)
+    braking = BrakingKernel(max_braking_force=values["max_braking_force"])
+
+    c = conditions
+    with np.errstate(divide="ignore", invalid="ignore"):
+        st = stability.evaluate_batch(
+            c["velocity"], c["radius"], c["acceleration"], c["slope"], c["bump_velocity"]
+        )
+        fr, _ = friction.evaluate_trajectory(
+            c["velocity"], c["radius"], c["acceleration"], c["slope"], c["surface_mu"]
+        )
+        br = braking.evaluate_batch(c["velocity"], body.m, c["surface_mu"], c["slope"], c["distance"])
+        max_safe_velocity = np.minimum.reduce([
+            np.broadcast_to(stability.max_safe_velocity(c["radius"], c["acceleration"], c["slope"], c["bump_velocity"]), fr.shape),
+            np.broadcast_to(friction.max_safe_velocity(c["radius"], c["acceleration"], c["slope"], c["surface_mu"]), fr.shape),
+            np.broadcast_to(braking.max_safe_velocity(body.m, c["surface_mu"], c["slope"], c["distance"]), fr.shape),
+        ])
+
+    results = {
+        **values,
+        "is_legal": st["is_legal"] & fr["is_legal"] & br["is_legal"],
+        "stability_legal": st["is_legal"],
+        "friction_legal": fr["is_legal"],
+        "braking_legal": br["is_legal"],
+        "stability_margin": st["stability_margin"],
+        "front_load_pct": st["front_load_pct"],
+        "grip_utilization": fr["grip_utilization"],
+        "slip_angle_deg": fr["slip_angle_deg"],
+        "stopping_distance_m": br["stopping_distance_m"],
+        "max_safe_velocity": max_safe_velocity,
+    }
+
+    # 3. Write this shard's slice of every column
+    for name, column in results.items():
+        out = open_memmap(os.path.join(output_dir, f"{name}.npy"), mode="r+")
+        out[lo:hi] = column
+        out.flush()
+        del out
+    return hi - lo
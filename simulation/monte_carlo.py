@@ -1,5 +1,11 @@
+import math
 import random
-from simulation.physics_simulator import simulate_braking
+from statistics import NormalDist
+
+import numpy as np
+
+from simulation.physics_simulator import simulate_braking_batch
+from simulation.samplers import sample
 
 def monte_carlo_collision_test(
     runs,
@@ -16,13 +22,271 @@ def monte_carlo_collision_test(
         f = random.uniform(friction * 0.8, friction * 1.2)
         b = random.uniform(brake_force * 0.8, brake_force * 1.2)
 
-        sim = simulate_braking(speed, f, b)
+        sim = simulate_braking_batch(speed, f, b, summary_only=True)
 
-        final_position = sim[-1]["position"]
+        final_position = sim["final_position"]
 
         if final_position > obstacle_distance:
             collisions += 1
 
     probability = collisions / runs
 
-    return probability
\ No newline at end of file
+    return probability
+
+def wilson_interval(successes, runs, confidence=0.95):
+    """Wilson score interval (low, high) for a binomial proportion."""
+    if runs == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / runs
+    denom = 1 + z**2 / runs
+    center = (p + z**2 / (2 * runs)) / denom
+    half = z * math.sqrt(p * (1 - p) / runs + z**2 / (4 * runs**2)) / denom
+
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def collision_block(rng, size, speed, friction, brake_force, obstacle_distance):
+    """
+    Number of collisions in `size` runs drawn from rng: friction and brake
+    force uniform within +/-20% of nominal, stopping position in closed form.
+    """
+    f = rng.uniform(friction * 0.8, friction * 1.2, size)
+    b = rng.uniform(brake_force * 0.8, brake_force * 1.2, size)
+
+    sim = simulate_braking_batch(speed, f, b, summary_only=True)
+
+    return int(np.count_nonzero(sim["final_position"] > obstacle_distance))
+
+
+def estimate_collision_probability(
+    speed,
+    friction,
+    brake_force,
+    obstacle_distance,
+    precision=0.005,
+    confidence=0.95,
+    block_size=10000,
+    max_runs=1000000,
+    seed=None
+):
+    """
+    Vectorized monte_carlo_collision_test(): draws runs in blocks from a
+    seeded numpy Generator and stops once the Wilson interval's half-width
+    is within `precision` (or after max_runs).
+    """
+    rng = np.random.default_rng(seed)
+
+    runs = 0
+    collisions = 0
+
+    while runs < max_runs:
+
+        size = min(block_size, max_runs - runs)
+        collisions += collision_block(rng, size, speed, friction, brake_force, obstacle_distance)
+        runs += size
+
+        low, high = wilson_interval(collisions, runs, confidence)
+        if (high - low) / 2 <= precision:
+            break
+
+    low, high = wilson_interval(collisions, runs, confidence)
+
+    return {
+        "probability": collisions / runs if runs else 0.0,
+        "ci_low": low,
+        "ci_high": high,
+        "confidence": confidence,
+        "runs": runs,
+        "collisions": collisions,
+        "converged": bool((high - low) / 2 <= precision)
+    }
+
+
+def importance_collision_probability(
+    speed,
+    friction,
+    brake_force,
+    obstacle_distance,
+    speed_spread=0.0,
+    rel_precision=0.05,
+    confidence=0.95,
+    block_size=2000,
+    max_runs=200000,
+    seed=None
+):
+    """
+    Importance-sampling estimate of the collision probability for rare
+    events. Friction and brake force (and speed, if speed_spread > 0) keep
+    their nominal uniform ranges, but each is drawn from a truncated
+    exponential tilted toward the worst corner (low friction, weak brakes,
+    high speed), with a rate sized to where the collision region ends along
+    that axis. Every run is weighted by nominal / proposal density, so
+    mean(weight * collided) is unbiased.
+
+    Sampling stops once the confidence half-width is within rel_precision
+    of the estimate (or after max_runs). Returns the probability, its
+    variance and interval, and the effective sample size of the weights.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Axis u in [0, 1] per input, u = 0 at the worst corner
+    lows = np.array([friction * 0.8, brake_force * 0.8, speed * (1 + speed_spread)])
+    spans = np.array([friction * 0.4, brake_force * 0.4, -2 * speed * speed_spread])
+
+    def collided(u):
+        f, b, v = (lows + u * spans).T
+        return simulate_braking_batch(v, f, b, summary_only=True)["final_position"] > obstacle_distance
+
+    # 1. TILT: where the collision region ends along each axis, the others worst
+    grid = np.linspace(0, 1, 1025)
+    rates = np.zeros(3)
+    for axis in range(3):
+        if spans[axis] == 0:
+            continue
+        u = np.zeros((len(grid), 3))
+        u[:, axis] = grid
+        hits = collided(u)
+        if not hits[0]:
+            # The worst corner is safe, so (by monotonicity) is everything
+            return {
+                "probability": 0.0, "variance": 0.0, "ci_low": 0.0, "ci_high": 0.0,
+                "confidence": confidence, "runs": 0, "collisions": 0, "ess": 0.0, "converged": True
+            }
+        extent = grid[hits].max()
+        rates[axis] = 0.0 if extent >= 1 else 1.0 / max(extent, 1e-3)
+
+    # 2. SAMPLE in blocks until the interval is tight enough
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    sum_w = sum_w2 = 0.0
+    probability = variance = 0.0
+    runs = 0
+    collisions = 0
+
+    while runs < max_runs:
+
+        size = min(block_size, max_runs - runs)
+        u, weight = _tilted_uniform(rng, rates, size)
+        values = weight * collided(u)
+
+        sum_w += values.sum()
+        sum_w2 += (values**2).sum()
+        collisions += int(np.count_nonzero(values))
+        runs += size
+
+        probability = sum_w / runs
+        variance = max(sum_w2 / runs - probability**2, 0.0) / runs
+        if collisions and z * math.sqrt(variance) <= rel_precision * probability:
+            break
+
+    half = z * math.sqrt(variance)
+
+    return {
+        "probability": float(probability),
+        "variance": float(variance),
+        "ci_low": max(0.0, float(probability - half)),
+        "ci_high": float(probability + half),
+        "confidence": confidence,
+        "runs": runs,
+        "collisions": collisions,
+        "ess": float(sum_w**2 / sum_w2) if sum_w2 > 0 else 0.0,
+        "converged": bool(collisions and half <= rel_precision * probability)
+    }
+
+
+def _tilted_uniform(rng, rates, size):
+    # Inverse-CDF draws from density rate * exp(-rate * u) / (1 - exp(-rate)) on [0, 1]
+    # per column (rate 0 = uniform), and the weights 1 / density
+    rates = np.asarray(rates, dtype=float)
+    r = rng.random((size, len(rates)))
+    tilted = rates > 0
+    safe_rates = np.where(tilted, rates, 1.0)
+    mass = -np.expm1(-safe_rates)
+
+    u = np.where(tilted, -np.log1p(-r * mass) / safe_rates, r)
+    density = np.where(tilted, safe_rates * np.exp(-safe_rates * u) / mass, 1.0)
+    return u, np.prod(1.0 / density, axis=1)
+
+
+def sampled_collision_probability(
+    runs,
+    speed,
+    friction,
+    brake_force,
+    obstacle_distance,
+    strategy="uniform",
+    speed_spread=0.0,
+    distance_spread=0.0,
+    seed=None
+):
+    """
+    monte_carlo_collision_test() with a selectable sampling strategy from
+    simulation.samplers ('uniform', 'latin_hypercube', 'halton', 'sobol').
+    Friction and brake force vary +/-20% as before; speed and obstacle
+    distance vary +/- their spread fraction. Returns the collision fraction
+    and the mean overshoot past the obstacle (a smooth companion metric).
+    """
+    u = sample(strategy, runs, 4, seed=seed)
+
+    f = friction * (0.8 + 0.4 * u[:, 0])
+    b = brake_force * (0.8 + 0.4 * u[:, 1])
+    v = speed * (1 - speed_spread + 2 * speed_spread * u[:, 2])
+    d = obstacle_distance * (1 - distance_spread + 2 * distance_spread * u[:, 3])
+
+    final_position = simulate_braking_batch(v, f, b, summary_only=True)["final_position"]
+
+    return {
+        "probability": float(np.mean(final_position > d)),
+        "mean_overshoot": float(np.mean(np.maximum(final_position - d, 0.0))),
+        "runs": runs,
+        "strategy": strategy
+    }
+
+
+def quadrature_collision_probability(
+    speed,
+    friction,
+    brake_force,
+    obstacle_distance,
+    speed_spread=0.0,
+    distance_spread=0.0,
+    points_per_axis=256
+):
+    """
+    Deterministic reference for sampled_collision_probability(). The
+    obstacle distance is integrated exactly (it is uniform and only enters
+    through the final position), and friction, brake force and speed on a
+    points_per_axis^3 midpoint grid, one friction slice at a time.
+    error_estimate is the change from a grid of half the resolution.
+    """
+    def integrate(n):
+        u = (np.arange(n) + 0.5) / n
+        b = brake_force * (0.8 + 0.4 * u)[:, None]
+        v = speed * (1 - speed_spread + 2 * speed_spread * u)[None, :]
+        near = obstacle_distance * (1 - distance_spread)
+        width = 2 * obstacle_distance * distance_spread
+
+        probability = overshoot = 0.0
+        for f in friction * (0.8 + 0.4 * u):
+            x = simulate_braking_batch(v, f, b, summary_only=True)["final_position"]
+            if width > 0:
+                # P(d < x) and E[max(x - d, 0)] for d ~ U(near, near + width)
+                inside = np.clip(x - near, 0.0, width)
+                probability += np.mean(inside / width)
+                overshoot += np.mean(inside**2 / (2 * width) + np.maximum(x - near - width, 0.0))
+            else:
+                probability += np.mean(x > near)
+                overshoot += np.mean(np.maximum(x - near, 0.0))
+        return probability / n, overshoot / n
+
+    probability, overshoot = integrate(points_per_axis)
+    coarse_probability, coarse_overshoot = integrate(points_per_axis // 2)
+
+    return {
+        "probability": float(probability),
+        "mean_overshoot": float(overshoot),
+        "probability_error_estimate": float(abs(probability - coarse_probability)),
+        "overshoot_error_estimate": float(abs(overshoot - coarse_overshoot)),
+        "points": points_per_axis**3
+    }
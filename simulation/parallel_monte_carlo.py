@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from simulation.monte_carlo import collision_block, wilson_interval
+
+
+def parallel_collision_test(
+    runs,
+    speed,
+    friction,
+    brake_force,
+    obstacle_distance,
+    seed=0,
+    block_size=250000,
+    workers=None,
+    confidence=0.95,
+    progress=None
+):
+    """
+    Sharded monte_carlo_collision_test() for very large run counts.
+
+    The runs are cut into fixed blocks of block_size, and block i draws from
+    its own stream spawned from SeedSequence(seed). Blocks are independent
+    of the pool, so the result is bit-for-bit identical for any worker
+    count (workers=0 runs in-process). Partial counts are merged as blocks
+    finish; progress, if given, is called with a snapshot after each one.
+    """
+    sizes = [min(block_size, runs - start) for start in range(0, runs, block_size)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = (speed, friction, brake_force, obstacle_distance)
+
+    start = time.perf_counter()
+    done = 0
+    collisions = 0
+
+    def merge(block_collisions, size):
+        nonlocal done, collisions
+        done += size
+        collisions += block_collisions
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            progress({
+                "runs_done": done,
+                "runs_total": runs,
+                "fraction": done / runs,
+                "probability": collisions / done,
+                "samples_per_s": done / elapsed if elapsed > 0 else None
+            })
+
+    if workers == 0:
+        for stream, size in zip(streams, sizes):
+            merge(_run_block(stream, size, *args), size)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_block, stream, size, *args): size
+                for stream, size in zip(streams, sizes)
+            }
+            for future in as_completed(futures):
+                merge(future.result(), futures[future])
+
+    elapsed = time.perf_counter() - start
+    low, high = wilson_interval(collisions, runs, confidence)
+
+    return {
+        "probability": collisions / runs if runs else 0.0,
+        "ci_low": low,
+        "ci_high": high,
+        "confidence": confidence,
+        "runs": runs,
+        "collisions": collisions,
+        "blocks": len(sizes),
+        "elapsed_s": elapsed,
+        "samples_per_s": runs / elapsed if elapsed > 0 else None
+    }
+
+
+def print_progress(snapshot):
+    """Default-style progress reporter for parallel_collision_test()."""
+    rate = snapshot["samples_per_s"]
+    throughput = f"{rate:,.0f} samples/s" if rate else "-"
+    print(
+        f"[MonteCarlo] {snapshot['runs_done']}/{snapshot['runs_total']} "
+        f"({snapshot['fraction']:.0%}) p={snapshot['probability']:.6f} {throughput}"
+    )
+
+
+def _run_block(seed_sequence, size, speed, friction, brake_force, obstacle_distance):
+    rng = np.random.default_rng(seed_sequence)
+    return collision_block(rng, size, speed, friction, brake_force, obstacle_distance)
@@ -1,25 +1,30 @@
 import math
 
-def simulate_braking(speed, friction, brake_force, dt=0.1):
+from alignment_core.physics.braking_model import braking_trajectories
 
-    g = 9.81
 
-    velocity = speed
-    position = 0
+def braking_deceleration(friction, brake_force):
 
-    timeline = []
+    g = 9.81
 
-    while velocity > 0:
+    return friction * g + brake_force * 0.1
 
-        decel = friction * g + brake_force * 0.1
 
-        velocity = max(0, velocity - decel * dt)
+def simulate_braking(speed, friction, brake_force, dt=0.1):
+
+    trajectory = braking_trajectories(speed, braking_deceleration(friction, brake_force), dt)
 
-        position += velocity * dt
+    return [
+        {"velocity": float(v), "position": float(p)}
+        for v, p in zip(trajectory["velocity"], trajectory["position"])
+    ]
 
-        timeline.append({
-            "velocity": velocity,
-            "position": position
-        })
 
-    return timeline
\ No newline at end of file
+def simulate_braking_batch(speed, friction, brake_force, dt=0.1, summary_only=False):
+    """
+    Vectorized simulate_braking(): speed, friction and brake_force may be
+    broadcastable arrays. Returns braking_trajectories() arrays (2-D
+    velocity/position, one row per run) or, with summary_only, just the
+    steps, stop time and final position of every run.
+    """
+    return braking_trajectories(speed, braking_deceleration(friction, brake_force), dt, summary_only)
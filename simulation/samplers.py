@@ -0,0 +1,126 @@
+import numpy as np
+
+# Joe & Kuo (new-joe-kuo-6.21201) primitive polynomials and initial direction
+# numbers for Sobol dimensions 2..10: (degree s, coefficients a, m_1..m_s).
+# Dimension 1 is the van der Corput sequence in base 2.
+SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+)
+
+SOBOL_BITS = 32
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
+
+
+def uniform(n, dims, seed=None):
+    """Plain pseudo-random points in [0, 1)^dims."""
+    return np.random.default_rng(seed).random((n, dims))
+
+
+def latin_hypercube(n, dims, seed=None):
+    """
+    Latin hypercube: every dimension has exactly one point in each of its
+    n equal strata, jittered uniformly inside the stratum.
+    """
+    rng = np.random.default_rng(seed)
+    strata = np.argsort(rng.random((n, dims)), axis=0)
+    return (strata + rng.random((n, dims))) / n
+
+
+def halton(n, dims, seed=None, skip=0):
+    """
+    Halton points (radical inverses in the first `dims` prime bases).
+    With a seed, a random Cranley-Patterson shift (mod 1) randomizes the
+    set so independent replicates give error bars.
+    """
+    if dims > len(PRIMES):
+        raise ValueError(f"Halton supports up to {len(PRIMES)} dimensions")
+
+    index = np.arange(skip + 1, skip + n + 1)
+    points = np.empty((n, dims))
+    for d, base in enumerate(PRIMES[:dims]):
+        i = index.copy()
+        value = np.zeros(n)
+        scale = 1.0 / base
+        while np.any(i > 0):
+            i, digit = np.divmod(i, base)
+            value += digit * scale
+            scale /= base
+        points[:, d] = value
+
+    if seed is not None:
+        points = (points + np.random.default_rng(seed).random(dims)) % 1.0
+    return points
+
+
+def sobol(n, dims, seed=None):
+    """
+    Sobol points (Gray-code order) from Joe-Kuo direction numbers. With a
+    seed, a random digital shift (XOR of every coordinate with a random
+    32-bit mask) randomizes the set while keeping its net structure.
+    For n a power of two every 1-D projection is stratified, as is the
+    first pair of dimensions; later pairs need not be (e.g. 32x32 bins at
+    n=1024), so order inputs by importance.
+    """
+    if dims > len(SOBOL_DIRECTIONS) + 1:
+        raise ValueError(f"Sobol supports up to {len(SOBOL_DIRECTIONS) + 1} dimensions")
+    if n >= 2**SOBOL_BITS:
+        raise ValueError("Too many Sobol points")
+
+    directions = _sobol_direction_numbers(dims)
+
+    # x_i = XOR of the direction numbers selected by the bits of gray(i)
+    index = np.arange(n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    points = np.zeros((n, dims), dtype=np.uint64)
+    for bit in range(max(int(n - 1).bit_length(), 1)):
+        selected = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        points[selected] ^= directions[:, bit]
+
+    if seed is not None:
+        shift = np.random.default_rng(seed).integers(0, 2**SOBOL_BITS, dims, dtype=np.uint64)
+        points ^= shift
+    return points.astype(float) / 2.0**SOBOL_BITS
+
+
+SAMPLERS = {
+    "uniform": uniform,
+    "latin_hypercube": latin_hypercube,
+    "halton": halton,
+    "sobol": sobol,
+}
+
+
+def sample(strategy, n, dims, seed=None):
+    """n points in [0, 1)^dims from one of SAMPLERS."""
+    try:
+        sampler = SAMPLERS[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown sampling strategy: {strategy}") from None
+    return sampler(n, dims, seed=seed)
+
+
+def _sobol_direction_numbers(dims):
+    # (dims, SOBOL_BITS) direction numbers v_j = m_j * 2^(BITS - j), as uint64
+    v = np.zeros((dims, SOBOL_BITS), dtype=np.uint64)
+    v[0] = [1 << (SOBOL_BITS - 1 - j) for j in range(SOBOL_BITS)]
+
+    for d in range(1, dims):
+        s, a, m = SOBOL_DIRECTIONS[d - 1]
+        row = [m[j] << (SOBOL_BITS - 1 - j) for j in range(s)]
+        for j in range(s, SOBOL_BITS):
+            value = row[j - s] ^ (row[j - s] >> s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    value ^= row[j - k]
+            row.append(value)
+        v[d] = row
+    return v
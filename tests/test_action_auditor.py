@@ -0,0 +1,106 @@
+import time
+
+from alignment_core.constraints.braking import BrakingKernel
+from alignment_core.constraints.friction import PANIC_GRIP_UTILIZATION, FrictionKernel
+from alignment_core.constraints.stability import StabilityKernel
+from alignment_core.decision.action_auditor import ActionAuditor
+from alignment_core.decision.predictive_kernel import PredictiveKernel
+from alignment_core.physics.mechanics import RigidBody, TireModel
+from alignment_core.world_model.terrain_manager import TerrainManager
+
+
+def make_auditor(surface="dry_asphalt", **options):
+    body = RigidBody(2200, 1.6, 2.9, 0.55)
+    return ActionAuditor(
+        robot=body,
+        stability=StabilityKernel(body),
+        friction=FrictionKernel(body, TireModel(40000), TerrainManager(default_surface=surface)),
+        braking=BrakingKernel(max_braking_force=3000),
+        load=None,
+        **options
+    )
+
+
+def test_panic_when_stability_vetoes_first():
+    auditor = make_auditor()
+    assert auditor.pipeline.order()[0] == "stability"
+
+    # Tight, fast turn: stability vetoes and grip is far past 0.99
+    result = auditor.audit_intent({"obstacle_distance": 100}, {"speed": 25.0, "steering": 10.0})
+
+    assert result["kernels"]["friction"]["grip_utilization"] > 0.99
+    assert result.get("panic") is True
+    assert result["summary"].startswith("PANIC OVERRIDE")
+
+
+def test_panic_when_braking_vetoes_first():
+    auditor = make_auditor()
+    names = [name for name, _, _ in auditor.pipeline.entries]
+    auditor.pipeline._veto_order.sort(key=lambda i: names[i] != "braking")
+    assert auditor.pipeline.order()[0] == "braking"
+
+    # Too close to stop, and the turn saturates the tires
+    result = auditor.audit_intent({"obstacle_distance": 1.0}, {"speed": 25.0, "steering": 10.0})
+
+    assert result["kernels"]["friction"]["grip_utilization"] > 0.99
+    assert result.get("panic") is True
+
+
+def test_solved_speed_does_not_trip_traction_panic():
+    # On ice the friction circle, not the slip angle, sets the limit
+    auditor = make_auditor("ice")
+    predictor = PredictiveKernel(auditor)
+
+    for radius in (5.0, 20.0, 80.0, 300.0):
+        for slope in (-5.0, 0.0):
+            solved = predictor.find_optimal_velocity(radius, slope=slope, dist_to_obj=1000)
+            assert solved["limiting_kernel"] == "friction"
+            speed = solved["max_safe_velocity"]
+            grip = auditor.friction.evaluate(speed, radius, 0, slope).grip_utilization
+
+            assert grip <= PANIC_GRIP_UTILIZATION
+            result = auditor.audit_intent({"obstacle_distance": 1000}, {"speed": speed, "steering": radius}, slope)
+            assert not result.get("panic")
+
+
+def slow_last_kernel(auditor, seconds):
+    *handles, (name, check, out) = auditor._realtime_handles
+
+    def slow_check(*args):
+        time.sleep(seconds)
+        return check(*args)
+
+    auditor._realtime_handles = (*handles, (name, slow_check, out))
+
+
+def test_realtime_deadline_caps_speed_at_emergency_speed():
+    auditor = make_auditor(realtime_deadline_s=1e-9, emergency_speed=2.0)
+
+    verdict = auditor.audit_realtime(10.0, 200.0)
+
+    assert verdict.deadline_missed
+    assert not verdict.authorized
+    assert verdict.approved_speed == 2.0
+    assert auditor.audit_realtime(1.0, 200.0).approved_speed == 1.0
+
+
+def test_realtime_completed_audit_is_not_a_deadline_miss():
+    auditor = make_auditor(realtime_deadline_s=0.005, emergency_speed=0.0)
+    slow_last_kernel(auditor, 0.02)
+
+    verdict = auditor.audit_realtime(10.0, 200.0)
+
+    assert verdict.latency_s > 0.005
+    assert not verdict.deadline_missed
+    assert verdict.authorized
+    assert verdict.approved_speed == 10.0
+
+
+def test_realtime_veto_wins_over_deadline():
+    auditor = make_auditor(realtime_deadline_s=1e-9, emergency_speed=2.0)
+
+    verdict = auditor.audit_realtime(25.0, 10.0)
+
+    assert verdict.vetoed_by == auditor.pipeline.order()[0]
+    assert not verdict.deadline_missed
+    assert verdict.approved_speed == 0.0
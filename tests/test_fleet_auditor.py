@@ -0,0 +1,53 @@
+import numpy as np
+
+from alignment_core.constraints.braking import BrakingKernel
+from alignment_core.constraints.friction import FrictionKernel
+from alignment_core.constraints.stability import StabilityKernel
+from alignment_core.decision.fleet_auditor import FleetAuditor
+from alignment_core.physics.mechanics import TireModel
+from alignment_core.physics.vehicle_profile import VehicleProfile
+from alignment_core.world_model.fleet import FleetStore
+from alignment_core.world_model.terrain_manager import TerrainManager
+
+
+def test_fleet_verdicts_match_single_agent_kernels():
+    rng = np.random.default_rng(0)
+    fleet = FleetStore(capacity=4)
+    agents = {}
+    for i in range(200):
+        values = {
+            "mass": rng.uniform(500, 3000), "load": rng.uniform(0, 500),
+            "wheelbase": rng.uniform(1.5, 3.5), "track_width": rng.uniform(1.0, 2.0),
+            "cog_height": rng.uniform(0.3, 1.5), "cog_x": rng.uniform(-0.3, 0.3), "cog_y": rng.uniform(-0.3, 0.3),
+            "cornering_stiffness": 40000.0, "velocity": rng.uniform(0, 25),
+            "radius": rng.choice([0.0, rng.uniform(-100, 100)]), "acceleration": rng.uniform(-4, 4),
+            "max_braking_force": rng.uniform(1000, 8000), "friction": 0.9,
+            "slope": rng.uniform(-10, 10), "obstacle_distance": rng.uniform(5, 80),
+        }
+        fleet.add(f"agent-{i}", **values)
+        agents[f"agent-{i}"] = values
+
+    audit = FleetAuditor().audit(fleet)
+
+    terrain = TerrainManager(default_surface="dry_asphalt")
+    limiting = set()
+    for i, agent_id in enumerate(audit["ids"]):
+        a = agents[agent_id]
+        body = VehicleProfile(m=a["mass"] + a["load"], tw=a["track_width"], wb=a["wheelbase"],
+                              cog_z=a["cog_height"], cog_x=a["cog_x"], cog_y=a["cog_y"])
+        verdicts = {
+            "stability": StabilityKernel(body).evaluate(a["velocity"], a["radius"], a["acceleration"], a["slope"]).is_legal,
+            "friction": FrictionKernel(body, TireModel(40000), terrain).evaluate(
+                a["velocity"], a["radius"], a["acceleration"], a["slope"]).is_legal,
+            "braking": BrakingKernel(max_braking_force=a["max_braking_force"]).evaluate(
+                a["velocity"], body.m, a["friction"], a["slope"], a["obstacle_distance"]).is_legal,
+        }
+        for name, legal in verdicts.items():
+            assert bool(audit["checks"][name][i]) == legal, (agent_id, name)
+
+        first_failure = next((name for name, legal in verdicts.items() if not legal), None)
+        assert audit["limiting_constraint"][i] == first_failure
+        assert bool(audit["is_legal"][i]) == (first_failure is None)
+        limiting.add(first_failure)
+
+    assert limiting == {None, "stability", "friction", "braking"}
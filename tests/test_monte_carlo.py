@@ -0,0 +1,19 @@
+from simulation.monte_carlo import estimate_collision_probability, importance_collision_probability
+
+
+def test_converged_is_a_python_bool():
+    results = [
+        estimate_collision_probability(15, 0.7, 20, 12, max_runs=20000, seed=1),
+        importance_collision_probability(15, 0.7, 20, 40, max_runs=4000, seed=1),
+        importance_collision_probability(15, 0.7, 20, 12, max_runs=4000, seed=1),
+    ]
+    for result in results:
+        assert type(result["converged"]) is bool
+
+
+def test_importance_sampling_with_no_runs():
+    result = importance_collision_probability(20, 0.7, 50, 19.8, max_runs=0)
+
+    assert result["runs"] == 0
+    assert result["probability"] == 0.0
+    assert result["converged"] is False
@@ -0,0 +1,64 @@
+import numpy as np
+
+from alignment_core.constraints.braking import BrakingKernel
+from alignment_core.constraints.friction import FrictionKernel
+from alignment_core.constraints.stability import StabilityKernel
+from alignment_core.decision.action_auditor import ActionAuditor
+from alignment_core.decision.predictive_kernel import PredictiveKernel
+from alignment_core.decision.safe_speed_table import SafeSpeedTable
+from alignment_core.physics.mechanics import RigidBody, TireModel
+from alignment_core.world_model.terrain_manager import TerrainManager
+
+
+def make_table():
+    body = RigidBody(2200, 1.6, 2.9, 0.55)
+    auditor = ActionAuditor(
+        robot=body,
+        stability=StabilityKernel(body),
+        friction=FrictionKernel(body, TireModel(40000), TerrainManager(default_surface="dry_asphalt")),
+        braking=BrakingKernel(max_braking_force=3000),
+        load=None
+    )
+    kernel = PredictiveKernel(auditor)
+    table = SafeSpeedTable(
+        kernel,
+        radii=np.geomspace(2.0, 1000.0, 48),
+        slopes=np.linspace(-15.0, 15.0, 13),
+        surface_mus=np.linspace(0.1, 1.0, 10),
+        distances=np.geomspace(0.5, 100.0, 40)
+    )
+    return kernel, table
+
+
+def test_mixed_cell_is_a_table_miss():
+    kernel, table = make_table()
+    radius, slope, mu, distance = 30.0, 5.0, 0.15, 20.0
+
+    # The enclosing cell mixes runaway (zero) and feasible corners
+    cell = tuple(
+        slice(i, i + 2) for i in (
+            int(np.searchsorted(axis, x, side="right")) - 1
+            for axis, x in zip(table.axes, (radius, slope, mu, distance))
+        )
+    )
+    corners = table.table[cell]
+    assert corners.min() <= 0 < corners.max()
+
+    exact = kernel.find_optimal_velocity(radius, slope, distance, surface_mu=mu)["max_safe_velocity"]
+    assert exact > 0
+    assert table.lookup(radius, slope, mu, distance) is None
+
+
+def test_lookup_never_exceeds_exact_limit():
+    kernel, table = make_table()
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        radius = rng.uniform(2.0, 1000.0)
+        slope = rng.uniform(-15.0, 15.0)
+        mu = rng.uniform(0.1, 1.0)
+        distance = rng.uniform(0.5, 100.0)
+        safe_v = table.lookup(radius, slope, mu, distance)
+        if safe_v is None:
+            continue
+        exact = min(40.0, *(float(v) for v in kernel.kernel_limits(radius, slope, distance, mu).values()))
+        assert safe_v <= exact + 1e-9
@@ -0,0 +1,34 @@
+from alignment_core.decision.speed_cache import SafeSpeedCache
+
+
+class FlakyPredictor:
+    """Solver that fails for the first `failures` calls."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def safe_speed(self, radius, slope=0, dist_to_obj=100):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("solver diverged")
+        return 10.0 + slope
+
+    def get_safe_speed(self, radius, slope=0, dist_to_obj=100):
+        try:
+            return self.safe_speed(radius, slope, dist_to_obj)
+        except Exception:
+            return 6.0
+
+
+def test_fallback_speed_is_not_cached():
+    cache = SafeSpeedCache(FlakyPredictor(failures=2))
+
+    assert cache.get_safe_speed(20.0, slope=1.2) == 6.0
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["errors"] == 1
+
+    # The next query retries the solver and caches the lower slope edge
+    assert cache.get_safe_speed(20.0, slope=1.2) == 11.0
+    assert cache.get_safe_speed(20.0, slope=1.2) == 11.0
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from alignment_core.constraints.braking import BrakingKernel
+from alignment_core.constraints.friction import FrictionKernel
+from alignment_core.constraints.stability import StabilityKernel
+from alignment_core.decision.worst_case import WorstCaseVerifier
+from alignment_core.physics.mechanics import TireModel
+from alignment_core.physics.vehicle_profile import VehicleProfile
+
+
+def make_verifier(**profile):
+    body = VehicleProfile(**{"m": 2200, "tw": 1.6, "wb": 2.9, "cog_z": 0.55, **profile})
+    return WorstCaseVerifier(body, TireModel(40000), BrakingKernel(max_braking_force=3000))
+
+
+def test_radius_straddling_zero():
+    verifier = make_verifier(cog_y=0.2)
+
+    moving = verifier.verify(10, 0.8, radius=(-50, 50))
+    assert not moving["is_safe"]
+    assert moving["grip_margin"] == moving["slip_margin_rad"] == moving["stability_margin"] == -math.inf
+    assert math.isfinite(moving["braking_margin_m"])
+
+    # Standing still, only the bump loads the roll axis: both sides count,
+    # and the narrower (right, cog_y > 0) one is reported
+    standing = verifier.verify(0, 0.8, radius=(-50, 50), bump_velocity=0.3)
+    right_only = verifier.verify(0, 0.8, radius=(10, 50), bump_velocity=0.3)
+    left_only = verifier.verify(0, 0.8, radius=(-50, -10), bump_velocity=0.3)
+    assert standing["stability_margin"] == right_only["stability_margin"] < left_only["stability_margin"]
+
+
+BOXES = [
+    # Left and right turns with a payload that may sit high and off-center
+    {"velocity": (8, 12), "friction": (0.6, 0.9), "slope_deg": (-5, 5), "payload": (0, 400),
+     "payload_position": ((-0.5, 0.5), (-0.3, 0.3), (0.2, 1.5)), "radius": (20, 60),
+     "acceleration": (-2, 2), "distance": (30, 50), "bump_velocity": (0, 0.2)},
+    {"velocity": (4, 9), "friction": (0.5, 0.8), "slope_deg": (0, 8), "payload": (100, 600),
+     "payload_position": ((0.0, 0.8), (0.1, 0.4), (0.8, 1.2)), "radius": (-40, -15),
+     "acceleration": (-3, 1), "distance": (15, 40), "bump_velocity": (0, 0.5)},
+    # Steering that may go either way or straight
+    {"velocity": (5, 10), "friction": (0.7, 0.9), "slope_deg": (-3, 3), "payload": (0, 200),
+     "payload_position": ((-0.2, 0.2), (-0.2, 0.2), (0.5, 1.0)), "radius": (-50, 50),
+     "acceleration": (-1, 1), "distance": (40, 60), "bump_velocity": (0, 0.1)},
+]
+
+
+def kernel_margins(body, tire, braking, p):
+    """Every margin the verifier bounds, from the real kernels at sample points p."""
+    stability = StabilityKernel(body).evaluate_batch(
+        p["velocity"], p["radius"], p["acceleration"], p["slope_deg"], p["bump_velocity"])
+    friction, _ = FrictionKernel(body, tire, terrain_manager=None).evaluate_trajectory(
+        p["velocity"], p["radius"], p["acceleration"], p["slope_deg"], p["friction"])
+    stopping = braking.evaluate_batch(p["velocity"], body.m, p["friction"], p["slope_deg"], p["distance"])
+    return {
+        "braking_margin_m": p["distance"] - stopping["stopping_distance_m"],
+        "grip_margin": 1.0 - friction["grip_utilization"],
+        "slip_margin_rad": 0.21 - np.abs(np.radians(friction["slip_angle_deg"])),
+        "stability_margin": stability["stability_margin"] - 0.1,
+        "front_load_margin_pct": stability["front_load_pct"] - 5.0,
+    }
+
+
+@pytest.mark.parametrize("box", BOXES)
+def test_bounds_hold_for_sampled_points(box):
+    verifier = make_verifier(cog_x=0.1, cog_y=-0.05)
+    bounds = verifier.verify(**box, velocity_splits=4)
+
+    rng = np.random.default_rng(7)
+    n = 20000
+    p = {name: rng.uniform(*box[name], n) for name in box if name != "payload_position"}
+    p["radius"][::50] = 0.0  # straight-line points where the box allows them
+    if not (box["radius"][0] <= 0 <= box["radius"][1]):
+        p["radius"][::50] = box["radius"][0]
+    position = [rng.uniform(*axis, n) for axis in box["payload_position"]]
+
+    body = verifier.robot.with_payload(p["payload"], *position)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sampled = kernel_margins(body, verifier.tire, verifier.braking, p)
+
+    for name, margins in sampled.items():
+        assert margins.min() >= bounds[name] - 1e-9, name